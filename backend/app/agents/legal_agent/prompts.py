@@ -6,6 +6,9 @@ JSON enforcement is handled by response_format in the centralized openai_client.
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Callable, Mapping
+
 SYSTEM_PROMPT = """You are a professional startup legal document drafter.
 
 ROLE:
@@ -166,9 +169,9 @@ Generate the complete Terms of Service as a JSON object with sections array."""
 
 # ── Prompt dispatcher ────────────────────────────────────────────────────
 
-PROMPT_BUILDERS = {
+PROMPT_BUILDERS: Mapping[str, Callable[..., str]] = MappingProxyType({
     "Non-Disclosure Agreement (NDA)": build_nda_prompt,
     "Founder Agreement": build_founder_agreement_prompt,
     "Privacy Policy": build_privacy_policy_prompt,
     "Terms of Service": build_terms_of_service_prompt,
-}
+})
@@ -6,13 +6,15 @@ and jurisdiction-specific notes. All rules are deterministic.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 
 
 # ── Governing law mappings ───────────────────────────────────────────────
 
-GOVERNING_LAW_MAP: Dict[str, str] = {
+GOVERNING_LAW_MAP: Mapping[str, str] = MappingProxyType({
     "united states": "Laws of the State of Delaware, United States",
     "usa": "Laws of the State of Delaware, United States",
     "us": "Laws of the State of Delaware, United States",
@@ -28,30 +30,39 @@ GOVERNING_LAW_MAP: Dict[str, str] = {
     "singapore": "Laws of the Republic of Singapore",
     "ireland": "Laws of Ireland",
     "netherlands": "Laws of the Kingdom of the Netherlands",
-}
+})
 
 # Countries requiring GDPR compliance in Privacy Policy
-GDPR_COUNTRIES = {
+GDPR_COUNTRIES: frozenset[str] = frozenset({
     "united kingdom", "uk", "germany", "france", "ireland",
     "netherlands", "italy", "spain", "portugal", "belgium",
     "austria", "sweden", "denmark", "finland", "norway",
     "poland", "czech republic", "romania", "hungary", "greece",
     "eu",
-}
+})
 
+# Jurisdictions that get an extra advisory note
+_US_JURISDICTIONS: frozenset[str] = frozenset({"united states", "usa", "us"})
+_EMERGING_JURISDICTIONS: frozenset[str] = frozenset({"pakistan", "india"})
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class JurisdictionContext:
-    """Deterministic context derived from geography and idea inputs."""
+    """Deterministic context derived from geography and idea inputs.
+
+    Frozen so ``resolve_jurisdiction`` can hand the same cached instance to
+    every caller.
+    """
 
     country: str
     governing_law: str
     requires_gdpr: bool
-    legal_notes: List[str] = field(default_factory=list)
+    legal_notes: Tuple[str, ...] = ()
 
 
+@lru_cache(maxsize=256)
 def resolve_jurisdiction(geography: str) -> JurisdictionContext:
-    """Resolve a geography string into a JurisdictionContext."""
+    """Resolve a geography string into a JurisdictionContext (memoised)."""
     geo_lower = geography.strip().lower()
 
     governing_law = GOVERNING_LAW_MAP.get(
@@ -67,11 +78,11 @@ def resolve_jurisdiction(geography: str) -> JurisdictionContext:
             "This jurisdiction falls under GDPR. Privacy Policy includes "
             "data subject rights, lawful basis for processing, and DPO contact."
         )
-    if geo_lower in ("united states", "usa", "us"):
+    if geo_lower in _US_JURISDICTIONS:
         notes.append(
             "US jurisdiction — consider state-specific privacy laws (CCPA for California)."
         )
-    if geo_lower in ("pakistan", "india"):
+    if geo_lower in _EMERGING_JURISDICTIONS:
         notes.append(
             "Emerging market jurisdiction — regulatory frameworks may be evolving. "
             "Recommend periodic legal review."
@@ -81,20 +92,21 @@ def resolve_jurisdiction(geography: str) -> JurisdictionContext:
         country=geography.strip().title(),
         governing_law=governing_law,
         requires_gdpr=requires_gdpr,
-        legal_notes=notes,
+        legal_notes=tuple(notes),
     )
 
 
 # ── Document type validation ────────────────────────────────────────────
 
-VALID_DOCUMENT_TYPES = {
+VALID_DOCUMENT_TYPES: Mapping[str, str] = MappingProxyType({
     "nda": "Non-Disclosure Agreement (NDA)",
     "founder_agreement": "Founder Agreement",
     "privacy_policy": "Privacy Policy",
     "terms_of_service": "Terms of Service",
-}
+})
 
 
+@lru_cache(maxsize=64)
 def validate_document_type(doc_type: str) -> str:
     """Validate and return the canonical document type label.
 
@@ -15,16 +15,40 @@ No personas. If any step fails, agent continues with degraded confidence — nev
 from __future__ import annotations
 
 import asyncio
+import math
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from .calculator import MarketSizeResult, calculate_market_size
 from .competitors import fetch_competitors
 from .reasoning import run_reasoning
 from .research import fetch_market_research_text
 
-
-@dataclass
+# Demand-strength point tables — ascending band edges, ``bisect_right``
+# returns the points index.
+# Pricing: < $10 → 8, $10–500 → 15, > $500 → 12 (upper edge is inclusive)
+_PRICE_BANDS: tuple[float, ...] = (10.0, math.nextafter(500.0, math.inf))
+_PRICE_POINTS: tuple[float, ...] = (8.0, 15.0, 12.0)
+# Competitors: none → 5 (unvalidated), 1–2 → 10 (emerging),
+# 3–10 → 20 (healthy), > 10 → 15 (crowded but validated)
+_COMPETITION_BANDS: tuple[int, ...] = (1, 3, 11)
+_COMPETITION_POINTS: tuple[float, ...] = (5.0, 10.0, 20.0, 15.0)
+
+# Industries with well-documented public market data (higher TAM confidence)
+_KNOWN_INDUSTRIES: frozenset[str] = frozenset({
+    "SaaS", "Fintech", "Healthtech", "E-commerce", "AI/ML",
+    "Marketplace", "Enterprise", "Saas/Marketplace",
+})
+
+# Overall-confidence adjustment keyed by OpenAI's self-reported confidence
+_OPENAI_CONFIDENCE_ADJ: Mapping[str, int] = MappingProxyType(
+    {"high": 10, "medium": 5, "low": -5}
+)
+
+
+@dataclass(slots=True)
 class MarketResearchResult:
     """Full output of the market research agent."""
 
@@ -63,22 +87,10 @@ def _compute_demand_strength(
     som_score = min(som_avg / 100_000_000 * 25.0, 25.0)
 
     # Pricing reasonableness contributes 0–15 points
-    if 10 <= pricing_estimate <= 500:
-        price_score = 15.0
-    elif pricing_estimate < 10:
-        price_score = 8.0
-    else:
-        price_score = 12.0
+    price_score = _PRICE_POINTS[bisect_right(_PRICE_BANDS, pricing_estimate)]
 
     # Competition signal: 3-10 competitors = healthy market = +20 pts
-    if 3 <= competitor_count <= 10:
-        comp_score = 20.0
-    elif competitor_count > 10:
-        comp_score = 15.0  # crowded but validated
-    elif competitor_count > 0:
-        comp_score = 10.0  # emerging
-    else:
-        comp_score = 5.0  # unvalidated
+    comp_score = _COMPETITION_POINTS[bisect_right(_COMPETITION_BANDS, competitor_count)]
 
     return round(min(growth_score + som_score + price_score + comp_score, 100.0), 1)
 
@@ -94,19 +106,16 @@ def _compute_confidence(
     has_exa_data: bool,
 ) -> dict[str, Any]:
     """Compute confidence scores based on data quality from all sources."""
-    known_industries = {
-        "SaaS", "Fintech", "Healthtech", "E-commerce", "AI/ML",
-        "Marketplace", "Enterprise", "Saas/Marketplace",
-    }
+    known_industry = industry in _KNOWN_INDUSTRIES
 
     # Base TAM confidence from industry recognition
-    tam_base = 70 if industry in known_industries else 45
+    tam_base = 70 if known_industry else 45
     # Boost if Tavily provided real data
     tam_boost = 15 if has_tavily_data else 0
     tam_confidence = min(tam_base + tam_boost, 90)
     tam_explanation = (
         f"Industry '{industry}' — "
-        + ("well-documented market data" if industry in known_industries else "limited public data")
+        + ("well-documented market data" if known_industry else "limited public data")
         + (" + Tavily research passages available" if has_tavily_data else " (no external research data)")
     )
 
@@ -128,8 +137,7 @@ def _compute_confidence(
     )
 
     # Adjust overall based on OpenAI confidence signal
-    confidence_map = {"high": 10, "medium": 5, "low": -5}
-    openai_adj = confidence_map.get(openai_confidence, 0)
+    openai_adj = _OPENAI_CONFIDENCE_ADJ.get(openai_confidence, 0)
 
     overall = round(
         (tam_confidence + sam_confidence + som_confidence) / 3.0 + openai_adj, 0
@@ -328,7 +336,7 @@ async def run_market_research(
         competitor_count=competitor_count,
     )
 
-    avg_growth = (calc.growth_rate_min + calc.growth_rate_max) / 2.0
+    avg_growth = calc.growth_rate_avg
 
     print(f"✅ [MR] COMPLETE: TAM=${calc.tam_min/1e9:.1f}–{calc.tam_max/1e9:.1f}B, "
           f"SOM=${calc.som_min/1e6:.1f}–{calc.som_max/1e6:.1f}M, "
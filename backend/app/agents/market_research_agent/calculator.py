@@ -11,12 +11,14 @@ SOM is always capped at 5% of SAM. All values are ranges (min/max).
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
 # ── Industry base market sizes (USD, global) — top-down fallback ──────────
-_INDUSTRY_BASE: dict[str, tuple[float, float]] = {
+_INDUSTRY_BASE: Mapping[str, tuple[float, float]] = MappingProxyType({
     "SaaS": (80_000_000_000, 250_000_000_000),
     "Saas/Marketplace": (50_000_000_000, 180_000_000_000),
     "Fintech": (100_000_000_000, 350_000_000_000),
@@ -32,11 +34,11 @@ _INDUSTRY_BASE: dict[str, tuple[float, float]] = {
     "Biotech": (50_000_000_000, 180_000_000_000),
     "Cleantech": (30_000_000_000, 120_000_000_000),
     "Logistics": (60_000_000_000, 200_000_000_000),
-}
+})
 _DEFAULT_BASE = (40_000_000_000, 150_000_000_000)
 
 # ── Geography multipliers (fraction of global TAM) ───────────────────────
-_GEO_MULT: dict[str, tuple[float, float]] = {
+_GEO_MULT: Mapping[str, tuple[float, float]] = MappingProxyType({
     "Global": (0.8, 1.0),
     "North America": (0.30, 0.40),
     "United States": (0.25, 0.35),
@@ -46,34 +48,49 @@ _GEO_MULT: dict[str, tuple[float, float]] = {
     "Africa": (0.02, 0.05),
     "Middle East": (0.03, 0.07),
     "Oceania": (0.02, 0.04),
-}
+})
 _DEFAULT_GEO = (0.10, 0.20)
 
 # ── Customer size multipliers (SAM fraction of geo-adjusted TAM) ─────────
-_CUST_SIZE_MULT: dict[str, tuple[float, float]] = {
+_CUST_SIZE_MULT: Mapping[str, tuple[float, float]] = MappingProxyType({
     "Individual": (0.10, 0.25),
     "SMB": (0.15, 0.30),
     "Mid-Market": (0.20, 0.35),
     "Enterprise": (0.25, 0.40),
-}
+})
 _DEFAULT_CUST = (0.15, 0.30)
 
 # ── Revenue model growth rate estimates (annual %) ───────────────────────
-_GROWTH_RATES: dict[str, tuple[float, float]] = {
+_GROWTH_RATES: Mapping[str, tuple[float, float]] = MappingProxyType({
     "Subscription": (12.0, 25.0),
     "One-time": (5.0, 12.0),
     "Marketplace Fee": (15.0, 30.0),
     "Ads": (8.0, 18.0),
-}
+})
 _DEFAULT_GROWTH = (8.0, 20.0)
 
 # ── SOM cap ──────────────────────────────────────────────────────────────
 SOM_MAX_FRACTION = 0.05  # SOM never exceeds 5% of SAM
 
+# ── SOM capture fraction by team size ────────────────────────────────────
+# Upper bounds (inclusive) are sorted ascending; ``bisect_left`` maps a team
+# size to its band: ≤3, ≤10, ≤50, >50.
+_TEAM_SIZE_BOUNDS: tuple[int, ...] = (3, 10, 50)
+_SOM_FRACTIONS: tuple[tuple[float, float], ...] = (
+    (0.001, 0.005),
+    (0.003, 0.01),
+    (0.005, 0.02),
+    (0.01, 0.05),
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class MarketSizeResult:
-    """Output of the TAM/SAM/SOM calculation."""
+    """Output of the TAM/SAM/SOM calculation.
+
+    ``growth_rate_avg`` is derived once at construction so downstream
+    consumers do not recompute the midpoint of the growth range.
+    """
 
     tam_min: float
     tam_max: float
@@ -85,6 +102,10 @@ class MarketSizeResult:
     growth_rate_min: float
     growth_rate_max: float
     assumptions: list[str]
+    growth_rate_avg: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.growth_rate_avg = (self.growth_rate_min + self.growth_rate_max) / 2.0
 
 
 def calculate_market_size(
@@ -162,14 +183,7 @@ def calculate_market_size(
     print(f"📊 [CALC] SAM: ${sam_min/1e9:.1f}B – ${sam_max/1e9:.1f}B")
 
     # ── SOM (capped at 5% of SAM) ────────────────────────────
-    if team_size <= 3:
-        som_fraction_min, som_fraction_max = 0.001, 0.005
-    elif team_size <= 10:
-        som_fraction_min, som_fraction_max = 0.003, 0.01
-    elif team_size <= 50:
-        som_fraction_min, som_fraction_max = 0.005, 0.02
-    else:
-        som_fraction_min, som_fraction_max = 0.01, 0.05
+    som_fraction_min, som_fraction_max = _SOM_FRACTIONS[bisect_left(_TEAM_SIZE_BOUNDS, team_size)]
 
     # Enforce SOM cap
     som_fraction_max = min(som_fraction_max, SOM_MAX_FRACTION)
@@ -8,38 +8,31 @@ from __future__ import annotations
 
 import asyncio
 import os
-import re
 import logging
+from itertools import islice
 from typing import List, Dict, Any
-from urllib.parse import urlparse
 
 import httpx
+import orjson
 
-from ...services.competitor_cleaner import clean_competitors
+from ...services.competitor_cleaner import (
+    clean_competitors,
+    extract_company_name,
+    extract_domain,
+)
+from ...services.http_client import get_http_client
+from ...services.search_cache import get_cached_async, set_cached_async
 
 # ---------------------------------------------------------------------------
 # Exa API configuration
 # ---------------------------------------------------------------------------
 _EXA_API_URL = "https://api.exa.ai/search"
-_REQUEST_TIMEOUT = 10.0
+_REQUEST_TIMEOUT = httpx.Timeout(10.0)
 _RESULTS_PER_QUERY = 10
+_TEXT_MAX_CHARACTERS = 300  # descriptions use text[:300]; Exa truncates server-side
 _MAX_RETRIES = 1
 _INITIAL_BACKOFF = 0.5
 
-# Domains that are directories / aggregators — never a competitor.
-_EXCLUDED_DOMAINS: frozenset[str] = frozenset(
-    {
-        "capterra.com", "g2.com", "g2crowd.com", "crunchbase.com",
-        "yelp.com", "alternativeto.net", "slant.co", "getapp.com",
-        "softwareadvice.com", "trustradius.com", "sourceforge.net",
-        "medium.com", "substack.com", "wordpress.com", "blogspot.com",
-        "techcrunch.com", "forbes.com", "entrepreneur.com", "inc.com",
-        "producthunt.com", "news.ycombinator.com", "reddit.com",
-        "twitter.com", "x.com", "linkedin.com", "quora.com",
-        "wikipedia.org", "youtube.com", "facebook.com", "instagram.com",
-    }
-)
-
 
 def _get_exa_key() -> str:
     """Read the Exa API key from the environment."""
@@ -50,41 +43,6 @@ def _get_exa_key() -> str:
     return key
 
 
-def _extract_domain(url: str) -> str:
-    """Return bare domain from URL."""
-    match = re.search(r"https?://(?:www\.)?([^/]+)", url.lower())
-    return match.group(1) if match else ""
-
-
-_EXCLUDED_URL_PATTERNS: tuple[str, ...] = (
-    "/blog", "/news", "/article", "/press", "/media",
-    "/resources/", "/insights/", "/learn/", "/guides/",
-)
-
-
-def _is_excluded(url: str) -> bool:
-    domain = _extract_domain(url)
-    if any(excl in domain for excl in _EXCLUDED_DOMAINS):
-        return True
-    url_lower = url.lower()
-    return any(pat in url_lower for pat in _EXCLUDED_URL_PATTERNS)
-
-
-def _extract_company_name(title: str, url: str) -> str:
-    """Best-effort company name from the page title or domain."""
-    if title:
-        parts = re.split(r"[\|\-\u2013\u2014:]", title)
-        if parts:
-            name = parts[0].strip()
-            name = re.sub(r"\s*\(.*?\)\s*", "", name)
-            if 2 < len(name) < 60:
-                return name
-    domain = _extract_domain(url)
-    if domain:
-        return domain.split(".")[0].title()
-    return "Unknown"
-
-
 async def _search_exa(api_key: str, query: str) -> List[Dict[str, Any]]:
     """Run a single Exa semantic search (async) and return result dicts."""
     headers = {
@@ -96,18 +54,22 @@ async def _search_exa(api_key: str, query: str) -> List[Dict[str, Any]]:
         "type": "auto",
         "numResults": _RESULTS_PER_QUERY,
         "contents": {
-            "text": True,
+            "text": {"maxCharacters": _TEXT_MAX_CHARACTERS},
             "highlights": True,
         },
     }
+    cached = await get_cached_async("exa", payload)
+    if cached is not None:
+        print(f"💾 [MR] Exa cache hit: {len(cached)} results for {query!r}")
+        return cached
     try:
-        async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT) as client:
-            response = await client.post(
-                _EXA_API_URL, headers=headers, json=payload,
-            )
+        response = await get_http_client().post(
+            _EXA_API_URL, headers=headers, json=payload, timeout=_REQUEST_TIMEOUT,
+        )
         if response.status_code == 200:
-            results = response.json().get("results", [])
+            results = orjson.loads(response.content).get("results", [])
             print(f"� [MR] Exa: {len(results)} results for {query!r}")
+            await set_cached_async("exa", payload, results)
             return results
         elif response.status_code in (400, 401, 402, 403, 404):
             print(f"⚠️  [MR] Exa non-retryable HTTP {response.status_code}")
@@ -184,7 +146,7 @@ async def fetch_competitors(query_bundle: dict) -> dict:
     desc_map: dict[str, str] = {}
     for result in raw_results:
         url = result.get("url", "")
-        domain = _extract_domain(url)
+        domain = extract_domain(url)
         if domain in seen_domains:
             continue
         seen_domains.add(domain)
@@ -194,10 +156,10 @@ async def fetch_competitors(query_bundle: dict) -> dict:
         if text:
             desc_parts.append(text[:300])
         if highlights:
-            desc_parts.append(" ".join(highlights[:2]))
+            desc_parts.append(" ".join(islice(highlights, 2)))
         description = " ".join(desc_parts).strip()[:400]
         title = result.get("title", "")
-        name = _extract_company_name(title, url)
+        name = extract_company_name(title, url)
         # Store description by both title-derived name and domain root
         desc_map[name.lower()] = description
         root = domain.split(".")[0].lower() if domain else ""
@@ -206,13 +168,14 @@ async def fetch_competitors(query_bundle: dict) -> dict:
 
     final_competitors = []
     for name in cleaned_names:
-        desc = desc_map.get(name.lower(), "")
+        lowered = name.lower()
+        desc = desc_map.get(lowered, "")
         if not desc:
             # Try partial match
-            for key, val in desc_map.items():
-                if name.lower() in key or key in name.lower():
-                    desc = val
-                    break
+            desc = next(
+                (val for key, val in desc_map.items() if lowered in key or key in lowered),
+                "",
+            )
         if not desc:
             desc = f"Competitor in {industry} space"
         final_competitors.append({"name": name, "description": desc})
@@ -15,7 +15,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from ...services.openai_client import call_openai_chat_async, get_openai_key, validate_required_keys
+from ...services.openai_client import (
+    call_openai_chat_async,
+    get_openai_key,
+    get_openai_model,
+    validate_required_keys,
+)
+from ...services.search_cache import get_cached_async, set_cached_async
 
 # ---------------------------------------------------------------------------
 # System prompt — hardened for anti-vague, practical, bounded outputs.
@@ -172,6 +178,14 @@ async def run_reasoning(
         one_line_description=one_line_description,
     )
 
+    # Opt-in exact-match cache (REASONING_CACHE_TTL_HOURS, off by default):
+    # identical prompt inputs reuse the earlier validated reasoning.
+    cache_request = {"model": get_openai_model(), "prompt": user_prompt}
+    cached = await get_cached_async("reasoning", cache_request)
+    if cached is not None:
+        print(f"💾 [OPENAI] Reasoning cache hit: confidence={cached.get('confidence')}")
+        return cached
+
     result = await _call_openai(user_prompt)
 
     if result is None:
@@ -205,4 +219,5 @@ async def run_reasoning(
     print(f"✅ [OPENAI] Growth rate: {result['growth_rate_estimate']}")
     print(f"✅ [OPENAI] Confidence: {result['confidence']}")
 
+    await set_cached_async("reasoning", cache_request, result)
     return result
@@ -10,15 +10,21 @@ import asyncio
 import os
 import re
 import logging
+from itertools import chain
 from typing import List, Dict, Any
 
 import httpx
+import orjson
+
+from ...services.http_client import get_http_client
+from ...services.search_cache import get_cached_async, set_cached_async
+from ...services.url_utils import url_key
 
 # ---------------------------------------------------------------------------
 # Tavily API configuration
 # ---------------------------------------------------------------------------
 _TAVILY_API_URL = "https://api.tavily.com/search"
-_REQUEST_TIMEOUT = 15.0  # seconds
+_REQUEST_TIMEOUT = httpx.Timeout(15.0)  # seconds
 _MAX_RESULTS_PER_QUERY = 5
 
 
@@ -31,13 +37,35 @@ def _get_tavily_key() -> str:
     return key
 
 
+# ---------------------------------------------------------------------------
+# Precompiled passage-cleaning patterns
+# ---------------------------------------------------------------------------
+_BOILERPLATE_RE = re.compile(
+    r"(?:Subscribe|Sign up|Log in|Cookie|Advertisement)[\s\S]{0,80}", re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Any one of these marks a passage as carrying market numbers; folded into a
+# single alternation so each passage is scanned once.
+_NUMERIC_SIGNAL_RE = re.compile(
+    "|".join((
+        r"\$[\d,.]+",           # Dollar amounts
+        r"\d+(?:\.\d+)?%",      # Percentages
+        r"\d+(?:\.\d+)?\s*(?:billion|million|trillion|bn|mn|B|M|T)\b",  # Revenue figures
+        r"CAGR",                # Compound annual growth rate
+        r"20[12]\d",            # Year references 2010-2029
+        r"\d{1,3}(?:,\d{3})+",  # Large numbers with commas
+    )),
+    re.IGNORECASE,
+)
+
+
 def _clean_passage(text: str) -> str:
     """Remove ads, navigation fragments, and collapse whitespace."""
     # Strip common boilerplate patterns
-    text = re.sub(r"(Subscribe|Sign up|Log in|Cookie|Advertisement)[\s\S]{0,80}", "", text, flags=re.IGNORECASE)
+    text = _BOILERPLATE_RE.sub("", text)
     # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
 
 def _has_numeric_signals(text: str) -> bool:
@@ -46,18 +74,7 @@ def _has_numeric_signals(text: str) -> bool:
     Looks for: dollar amounts, percentages, billions/millions, CAGR,
     year references (2020-2030), or large numbers with commas.
     """
-    patterns = [
-        r"\$[\d,.]+",           # Dollar amounts
-        r"\d+(\.\d+)?%",        # Percentages
-        r"\d+(\.\d+)?\s*(billion|million|trillion|bn|mn|B|M|T)\b",  # Revenue figures
-        r"CAGR",                # Compound annual growth rate
-        r"20[12]\d",            # Year references 2010-2029
-        r"\d{1,3}(,\d{3})+",   # Large numbers with commas
-    ]
-    for pattern in patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    return _NUMERIC_SIGNAL_RE.search(text) is not None
 
 
 def _build_queries(
@@ -104,13 +121,19 @@ async def _search_tavily(api_key: str, query: str) -> List[Dict[str, Any]]:
         "max_results": _MAX_RESULTS_PER_QUERY,
         "include_answer": False,
     }
+    cached = await get_cached_async("tavily", payload)
+    if cached is not None:
+        print(f"\U0001f4be [MR] Tavily cache hit: {len(cached)} results for {query!r}")
+        return cached
     try:
-        async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT) as client:
-            response = await client.post(_TAVILY_API_URL, json=payload)
+        response = await get_http_client().post(
+            _TAVILY_API_URL, json=payload, timeout=_REQUEST_TIMEOUT,
+        )
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             results = data.get("results", [])
             print(f"\U0001f4e6 [MR] Tavily: {len(results)} results for {query!r}")
+            await set_cached_async("tavily", payload, results)
             return results
         else:
             print(f"\u26a0\ufe0f [MR] Tavily HTTP {response.status_code} for {query!r}")
@@ -153,32 +176,32 @@ async def fetch_market_research_text(query_bundle: dict) -> list[str]:
     )
 
     all_passages: list[str] = []
-    seen_urls: set[str] = set()
+    seen_urls: set[bytes] = set()
     numeric_passage_count = 0
 
     # Run all Tavily queries in parallel
     tasks = [_search_tavily(api_key, q) for q in queries]
     query_results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    for query_result in query_results:
-        if isinstance(query_result, Exception):
+    for result in chain.from_iterable(
+        query_result for query_result in query_results
+        if not isinstance(query_result, Exception)
+    ):
+        key = url_key(result.get("url", ""))
+        if key in seen_urls:
             continue
-        for result in query_result:
-            url = result.get("url", "")
-            if url in seen_urls:
-                continue
-            seen_urls.add(url)
-
-            content = result.get("content", "")
-            if not content or len(content) < 50:
-                continue
-
-            cleaned = _clean_passage(content)
-            if len(cleaned) >= 50:
-                all_passages.append(cleaned)
-                # Check if passage contains numeric anchors
-                if _has_numeric_signals(cleaned):
-                    numeric_passage_count += 1
+        seen_urls.add(key)
+
+        content = result.get("content", "")
+        if not content or len(content) < 50:
+            continue
+
+        cleaned = _clean_passage(content)
+        if len(cleaned) >= 50:
+            all_passages.append(cleaned)
+            # Check if passage contains numeric anchors
+            if _has_numeric_signals(cleaned):
+                numeric_passage_count += 1
 
     total = len(all_passages)
     print(f"✅ [TAVILY] Retrieved {total} research passages")
@@ -7,7 +7,8 @@ No LLM calls, no randomness. Pure rule-based decisions.
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from .rules import (
     MVPDecisionContext,
@@ -22,6 +23,14 @@ from .rules import (
 )
 from .schema import MVPBlueprint
 
+# Plain-language audience label for each customer size
+_CUSTOMER_SIZE_LABELS: Mapping[str, str] = MappingProxyType({
+    "Individual": "individual consumers",
+    "SMB": "small and medium businesses",
+    "Mid-Market": "mid-market companies",
+    "Enterprise": "enterprise organizations",
+})
+
 
 def generate_mvp_blueprint(
     *,
@@ -103,12 +112,7 @@ def generate_mvp_blueprint(
     )
 
     # ── Primary user ──────────────────────────────────────────
-    size_label = {
-        "Individual": "individual consumers",
-        "SMB": "small and medium businesses",
-        "Mid-Market": "mid-market companies",
-        "Enterprise": "enterprise organizations",
-    }.get(customer_size, customer_size)
+    size_label = _CUSTOMER_SIZE_LABELS.get(customer_size, customer_size)
 
     primary_user = f"{target_customer_type} — {size_label} in {industry} ({geography})"
 
@@ -7,10 +7,11 @@ decisions. Rules are composable and applied sequentially.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 
-@dataclass
+@dataclass(slots=True)
 class MVPDecisionContext:
     """All inputs the rules engine needs."""
 
@@ -58,6 +59,16 @@ def decide_mvp_type(ctx: MVPDecisionContext) -> str:
 
 # ── Feature scope ─────────────────────────────────────────────────────
 
+# (name, description) of the revenue feature, keyed by revenue model
+_REVENUE_FEATURE: Mapping[str, tuple[str, str]] = MappingProxyType({
+    "Subscription": ("Subscription Billing", "Basic subscription management and payment processing"),
+    "One-time": ("One-time Purchase", "Simple checkout and payment flow"),
+    "Marketplace Fee": ("Marketplace Matching", "Connect buyers and sellers with transaction fee"),
+    "Ads": ("Content Feed", "Content display with basic ad placement slots"),
+})
+_DEFAULT_REVENUE_FEATURE = ("Payment Integration", "Basic payment processing")
+
+
 def decide_core_features(ctx: MVPDecisionContext) -> List[Dict[str, str]]:
     """Determine core MVP features based on scores and idea context."""
     features: List[Dict[str, str]] = []
@@ -75,13 +86,8 @@ def decide_core_features(ctx: MVPDecisionContext) -> List[Dict[str, str]]:
     })
 
     # Revenue model feature
-    rev_feature = {
-        "Subscription": {"name": "Subscription Billing", "description": "Basic subscription management and payment processing"},
-        "One-time": {"name": "One-time Purchase", "description": "Simple checkout and payment flow"},
-        "Marketplace Fee": {"name": "Marketplace Matching", "description": "Connect buyers and sellers with transaction fee"},
-        "Ads": {"name": "Content Feed", "description": "Content display with basic ad placement slots"},
-    }
-    features.append(rev_feature.get(ctx.revenue_model, {"name": "Payment Integration", "description": "Basic payment processing"}))
+    name, description = _REVENUE_FEATURE.get(ctx.revenue_model, _DEFAULT_REVENUE_FEATURE)
+    features.append({"name": name, "description": description})
 
     # Add analytics if feasibility allows
     if ctx.execution_feasibility >= 50:
@@ -100,24 +106,34 @@ def decide_core_features(ctx: MVPDecisionContext) -> List[Dict[str, str]]:
     return features
 
 
+# Fixed exclusion groups — built once, copied into each result
+_ALWAYS_EXCLUDED: tuple[str, ...] = (
+    "Advanced reporting and business intelligence",
+    "Multi-language / internationalization support",
+    "Native mobile apps (web-first approach)",
+)
+_LOW_FEASIBILITY_EXCLUDED: tuple[str, ...] = (
+    "Complex automation workflows",
+    "AI/ML-powered features",
+)
+_SMALL_TEAM_EXCLUDED: tuple[str, ...] = (
+    "Admin panel with role-based access control",
+    "API integrations with third-party tools",
+)
+
+
 def decide_excluded_features(ctx: MVPDecisionContext) -> List[str]:
     """Determine features to explicitly exclude from MVP."""
-    excluded: List[str] = []
-
-    excluded.append("Advanced reporting and business intelligence")
-    excluded.append("Multi-language / internationalization support")
-    excluded.append("Native mobile apps (web-first approach)")
+    excluded: List[str] = list(_ALWAYS_EXCLUDED)
 
     if ctx.execution_feasibility < 50:
-        excluded.append("Complex automation workflows")
-        excluded.append("AI/ML-powered features")
+        excluded.extend(_LOW_FEASIBILITY_EXCLUDED)
 
     if ctx.problem_intensity < 50:
         excluded.append("Advanced customization and personalization")
 
     if ctx.team_size <= 2:
-        excluded.append("Admin panel with role-based access control")
-        excluded.append("API integrations with third-party tools")
+        excluded.extend(_SMALL_TEAM_EXCLUDED)
 
     if ctx.regulatory_risk > 0.6:
         excluded.append("Self-service compliance tools (handle manually first)")
@@ -127,6 +143,15 @@ def decide_excluded_features(ctx: MVPDecisionContext) -> List[str]:
 
 # ── User flow ─────────────────────────────────────────────────────────
 
+# Monetisation step of the user journey, keyed by revenue model
+_MONETISATION_STEP: Mapping[str, str] = MappingProxyType({
+    "Subscription": "User starts free trial or selects subscription plan",
+    "Marketplace Fee": "User posts listing or browses marketplace",
+    "One-time": "User completes one-time purchase",
+})
+_DEFAULT_MONETISATION_STEP = "User engages with free content"
+
+
 def decide_user_flow(ctx: MVPDecisionContext) -> List[str]:
     """Build the primary user journey for the MVP."""
     flow: List[str] = [
@@ -141,14 +166,7 @@ def decide_user_flow(ctx: MVPDecisionContext) -> List[str]:
 
     flow.append(f"User accesses core feature: {ctx.one_line_description}")
 
-    if ctx.revenue_model == "Subscription":
-        flow.append("User starts free trial or selects subscription plan")
-    elif ctx.revenue_model == "Marketplace Fee":
-        flow.append("User posts listing or browses marketplace")
-    elif ctx.revenue_model == "One-time":
-        flow.append("User completes one-time purchase")
-    else:
-        flow.append("User engages with free content")
+    flow.append(_MONETISATION_STEP.get(ctx.revenue_model, _DEFAULT_MONETISATION_STEP))
 
     flow.append("User receives value and sees first result")
     flow.append("User provides feedback or shares with others")
@@ -158,12 +176,17 @@ def decide_user_flow(ctx: MVPDecisionContext) -> List[str]:
 
 # ── Tech stack ────────────────────────────────────────────────────────
 
+# Revenue models that need a payment provider in the stack
+_PAID_REVENUE_MODELS: frozenset[str] = frozenset({"Subscription", "One-time", "Marketplace Fee"})
+
+
 def decide_tech_stack(ctx: MVPDecisionContext) -> Dict[str, str]:
     """Recommend tech stack based on team size and complexity."""
     stack: Dict[str, str] = {}
+    small_team = ctx.team_size <= 2
 
     # Frontend
-    if ctx.team_size <= 2:
+    if small_team:
         stack["frontend"] = "Next.js + TailwindCSS (rapid development)"
     else:
         stack["frontend"] = "React + TypeScript + TailwindCSS"
@@ -171,7 +194,7 @@ def decide_tech_stack(ctx: MVPDecisionContext) -> Dict[str, str]:
     # Backend
     if ctx.tech_complexity > 0.7:
         stack["backend"] = "Python (FastAPI) — good for data-heavy workloads"
-    elif ctx.team_size <= 2:
+    elif small_team:
         stack["backend"] = "Node.js (Express) or Python (FastAPI) — pick team's strongest language"
     else:
         stack["backend"] = "Python (FastAPI) + PostgreSQL"
@@ -180,7 +203,7 @@ def decide_tech_stack(ctx: MVPDecisionContext) -> Dict[str, str]:
     stack["database"] = "PostgreSQL (reliable, scalable)"
 
     # Hosting
-    if ctx.team_size <= 2:
+    if small_team:
         stack["hosting"] = "Vercel (frontend) + Railway or Render (backend)"
     else:
         stack["hosting"] = "AWS or GCP with managed services"
@@ -189,7 +212,7 @@ def decide_tech_stack(ctx: MVPDecisionContext) -> Dict[str, str]:
     stack["auth"] = "Clerk or Auth0 (avoid building auth from scratch)"
 
     # Payments
-    if ctx.revenue_model in ("Subscription", "One-time", "Marketplace Fee"):
+    if ctx.revenue_model in _PAID_REVENUE_MODELS:
         stack["payments"] = "Stripe (industry standard for MVP)"
 
     return stack
@@ -249,38 +272,56 @@ def decide_build_plan(ctx: MVPDecisionContext) -> Dict[str, Any]:
 
 # ── Validation plan ──────────────────────────────────────────────────
 
+_BASE_METRICS: tuple[str, ...] = (
+    "Signup conversion rate (target: >5%)",
+    "Weekly active users (WAU)",
+    "User retention at Day 7 and Day 30",
+)
+_REVENUE_METRICS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "Subscription": (
+        "Free-to-paid conversion rate (target: >2%)",
+        "Monthly recurring revenue (MRR)",
+    ),
+    "Marketplace Fee": (
+        "Transaction volume and gross merchandise value",
+        "Repeat transaction rate",
+    ),
+})
+_DEFAULT_REVENUE_METRICS: tuple[str, ...] = ("Revenue per user",)
+
+_BASE_METHODS: tuple[str, ...] = (
+    "User interviews (minimum 10 users in first 2 weeks)",
+    "In-app feedback widget for qualitative signals",
+)
+_CONFIDENCE_METHODS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "low": (
+        "Smoke test: measure demand before building full feature",
+        "Concierge delivery: manually fulfill first 20 orders",
+    ),
+    "medium": (
+        "A/B test landing page messaging",
+        "Track feature usage heatmaps",
+    ),
+})
+_DEFAULT_CONFIDENCE_METHODS: tuple[str, ...] = (
+    "Cohort analysis on early adopters",
+    "Net Promoter Score (NPS) survey at Day 14",
+)
+
+
 def decide_validation_plan(ctx: MVPDecisionContext) -> Dict[str, Any]:
     """Create a validation plan to test the core hypothesis."""
-    metrics: List[str] = []
-    methods: List[str] = []
-
-    # Always track these
-    metrics.append("Signup conversion rate (target: >5%)")
-    metrics.append("Weekly active users (WAU)")
-    metrics.append("User retention at Day 7 and Day 30")
-
-    if ctx.revenue_model == "Subscription":
-        metrics.append("Free-to-paid conversion rate (target: >2%)")
-        metrics.append("Monthly recurring revenue (MRR)")
-    elif ctx.revenue_model == "Marketplace Fee":
-        metrics.append("Transaction volume and gross merchandise value")
-        metrics.append("Repeat transaction rate")
-    else:
-        metrics.append("Revenue per user")
+    # Always track these, plus revenue-model specific metrics
+    metrics: List[str] = [
+        *_BASE_METRICS,
+        *_REVENUE_METRICS.get(ctx.revenue_model, _DEFAULT_REVENUE_METRICS),
+    ]
 
     # Validation methods based on confidence
-    methods.append("User interviews (minimum 10 users in first 2 weeks)")
-    methods.append("In-app feedback widget for qualitative signals")
-
-    if ctx.market_confidence == "low":
-        methods.append("Smoke test: measure demand before building full feature")
-        methods.append("Concierge delivery: manually fulfill first 20 orders")
-    elif ctx.market_confidence == "medium":
-        methods.append("A/B test landing page messaging")
-        methods.append("Track feature usage heatmaps")
-    else:
-        methods.append("Cohort analysis on early adopters")
-        methods.append("Net Promoter Score (NPS) survey at Day 14")
+    methods: List[str] = [
+        *_BASE_METHODS,
+        *_CONFIDENCE_METHODS.get(ctx.market_confidence, _DEFAULT_CONFIDENCE_METHODS),
+    ]
 
     success_criteria = "Achieve 100 signups and >5% activation rate within 4 weeks of launch"
     if ctx.problem_intensity >= 70:
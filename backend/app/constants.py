@@ -9,11 +9,17 @@ country lists, and customer type enums. Reused by:
 
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Mapping
+
+# Tables below are read-only at runtime: sequences are tuples and lookup
+# maps are MappingProxyType views, so no request can mutate shared state.
+
 # ── Standardized Industry Taxonomy ──────────────────────────────────────
 # Multi-select. Used to drive queries, competitor discovery, and market sizing.
 # LOCKED — changes here must be mirrored in frontend/src/lib/constants.ts.
 
-INDUSTRIES: list[str] = [
+INDUSTRIES: tuple[str, ...] = (
     "SaaS",
     "Artificial Intelligence",
     "FinTech",
@@ -57,34 +63,34 @@ INDUSTRIES: list[str] = [
     "Energy",
     "Smart Cities",
     "Non-Profit / Social Impact",
-]
+)
 
 # Frozen set for fast membership checks
 INDUSTRIES_SET: frozenset[str] = frozenset(INDUSTRIES)
 
 # ── Target Customer Types ───────────────────────────────────────────────
-CUSTOMER_TYPES: list[str] = ["B2B", "B2C", "B2B2C"]
+CUSTOMER_TYPES: tuple[str, ...] = ("B2B", "B2C", "B2B2C")
 
 # ── OpenAI Inference: complexity / risk level mapping ───────────────────
 # These map the LLM-inferred levels to 0-1 values stored on the Idea model.
 # The normalization engine then multiplies by 100 to get 0-100 scores.
 
-TECH_COMPLEXITY_MAP: dict[str, float] = {
+TECH_COMPLEXITY_MAP: Mapping[str, float] = MappingProxyType({
     "low": 0.20,      # → 20 after normalization
     "medium": 0.50,    # → 50 after normalization
     "high": 0.75,      # → 75 after normalization
-}
+})
 
-REGULATORY_RISK_MAP: dict[str, float] = {
+REGULATORY_RISK_MAP: Mapping[str, float] = MappingProxyType({
     "low": 0.20,       # → 20 after normalization
     "medium": 0.50,    # → 50 after normalization
     "high": 0.80,      # → 80 after normalization
-}
+})
 
 # ── Revenue Model Defaults ──────────────────────────────────────────────
 # Used when OpenAI infers a revenue_model string — map to known categories
 # for the market research calculator.
-KNOWN_REVENUE_MODELS: list[str] = [
+KNOWN_REVENUE_MODELS: tuple[str, ...] = (
     "Subscription",
     "One-time",
     "Marketplace Fee",
@@ -93,11 +99,11 @@ KNOWN_REVENUE_MODELS: list[str] = [
     "Usage-based",
     "Licensing",
     "Transaction Fee",
-]
+)
 
 # Default pricing estimates (USD/month) by revenue model — used when user
 # does not provide pricing (which is now always, since we removed that input).
-DEFAULT_PRICING: dict[str, float] = {
+DEFAULT_PRICING: Mapping[str, float] = MappingProxyType({
     "Subscription": 49.0,
     "One-time": 99.0,
     "Marketplace Fee": 100.0,
@@ -106,14 +112,14 @@ DEFAULT_PRICING: dict[str, float] = {
     "Usage-based": 50.0,
     "Licensing": 199.0,
     "Transaction Fee": 50.0,
-}
+})
 DEFAULT_PRICING_FALLBACK: float = 49.0
 
 # Default customer size mapping from target_customer_type
-CUSTOMER_TYPE_TO_SIZE: dict[str, str] = {
+CUSTOMER_TYPE_TO_SIZE: Mapping[str, str] = MappingProxyType({
     "B2B": "SMB",
     "B2C": "Individual",
     "B2B2C": "SMB",
-}
+})
 
 DEFAULT_TEAM_SIZE: int = 5
@@ -10,7 +10,8 @@ from fastapi.responses import JSONResponse
 
 logger = logging.getLogger(__name__)
 
-from .database import Base, engine
+from .database import Base, get_engine
+from .services.http_client import close_http_client
 from .routes.auth import router as auth_router
 from .routes.ideas import router as ideas_router
 from .routes.evaluation import router as evaluation_router
@@ -27,7 +28,7 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # ── Ensure tables exist (PostgreSQL) ──────────────────────────
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
     print("✅ [DB] Tables ensured")
 
     # Log Google OAuth status at startup
@@ -35,6 +36,7 @@ async def lifespan(app: FastAPI):
     log_google_oauth_status()
 
     yield
+    await close_http_client()
     print("Shutting down StartBot API")
 
 
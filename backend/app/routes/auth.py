@@ -52,6 +52,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Characters stripped from an email prefix to form a username
+_USERNAME_INVALID_RE = re.compile(r"[^a-zA-Z0-9_]")
+
 
 # ===================================================================== #
 #  Utility: build UserPublic from ORM                                     #
@@ -292,7 +295,7 @@ def google_callback(
     user = db.query(User).filter(User.email == google_email).first()
     if user is None:
         # Generate a unique username from the Google email prefix
-        base_username = re.sub(r"[^a-zA-Z0-9_]", "", google_email.split("@")[0])[:15]
+        base_username = _USERNAME_INVALID_RE.sub("", google_email.split("@")[0])[:15]
         if len(base_username) < 3:
             base_username = "user"
         username = base_username
@@ -22,7 +22,6 @@ from ..models.user import User
 from ..services.auth_dependency import get_current_user
 from ..schemas.evaluation_schema import IdeaEvaluationReport
 from ..schemas.normalized_schema import NormalizedSignals
-from ..schemas.score_schema import ModuleScores
 from ..schemas.problem_intensity_schema import ProblemIntensitySignals
 from ..schemas.trend_schema import TrendDemandSignals
 from ..schemas.competitor_schema import CompetitorSignals
@@ -32,6 +31,7 @@ from ..services.trend_agent import fetch_trend_demand_signals
 from ..services.competitor_agent import fetch_competitor_signals
 from ..services.normalization_engine import normalize_signals
 from ..services.scoring_engine import compute_scores
+from ..services.summary import generate_summary
 from ..services.vector_store import chunk_evaluation, index_chunks_async
 from ..services.idea_inference import (
     infer_idea_attributes,
@@ -49,51 +49,6 @@ router = APIRouter(
 )
 
 
-# ===================================================================== #
-#  Rule-based summary generation                                          #
-# ===================================================================== #
-
-def _generate_summary(scores: ModuleScores) -> dict[str, str]:
-    """Produce a rule-based summary dict from module scores.  No LLM."""
-
-    # --- verdict ---
-    final = scores.final_viability_score
-    if final >= 75:
-        verdict = "Strong"
-    elif final >= 55:
-        verdict = "Moderate"
-    else:
-        verdict = "Weak"
-
-    # --- risk_level ---
-    if scores.competition_pressure < 40 or scores.execution_feasibility < 30:
-        risk_level = "High"
-    elif scores.competition_pressure < 60 or scores.execution_feasibility < 50:
-        risk_level = "Medium"
-    else:
-        risk_level = "Low"
-
-    # --- key_strength (highest scoring module) ---
-    module_map: dict[str, float] = {
-        "Problem Intensity": scores.problem_intensity,
-        "Market Timing": scores.market_timing,
-        "Competition Pressure": scores.competition_pressure,
-        "Market Potential": scores.market_potential,
-        "Execution Feasibility": scores.execution_feasibility,
-    }
-    key_strength = max(module_map, key=module_map.get)  # type: ignore[arg-type]
-
-    # --- key_risk (lowest scoring module) ---
-    key_risk = min(module_map, key=module_map.get)  # type: ignore[arg-type]
-
-    return {
-        "verdict": verdict,
-        "risk_level": risk_level,
-        "key_strength": key_strength,
-        "key_risk": key_risk,
-    }
-
-
 # ===================================================================== #
 #  Graceful-degradation defaults                                          #
 # ===================================================================== #
@@ -144,7 +99,8 @@ async def evaluate_idea(
     Pipeline order:
     1. Fetch Idea from DB
     2. Build QueryBundle
-    3. Fetch ProblemIntensitySignals (Tavily + SerpAPI, no Reddit)
+    3. Fetch ProblemIntensitySignals (Tavily + SerpAPI, no Reddit) —
+       started alongside step 2, it only reads user-entered fields
     4. Fetch TrendDemandSignals
     5. Fetch CompetitorSignals
     6. Normalize → NormalizedSignals
@@ -163,6 +119,10 @@ async def evaluate_idea(
             detail=f"Idea {idea_id} not found",
         )
 
+    # Problem intensity needs only user-entered fields, so its Tavily/SerpAPI
+    # round-trips overlap the OpenAI inference call instead of waiting on it.
+    problem_task = asyncio.ensure_future(fetch_problem_intensity_signals(idea))
+
     try:
         # ── 2. OpenAI Inference — infer attributes from description ────
         logger.info("Pipeline step 2: Inferring idea attributes via OpenAI")
@@ -204,7 +164,6 @@ async def evaluate_idea(
         logger.info("Pipeline steps 4-6: Fetching all signals in parallel")
         t_start = time.perf_counter()
 
-        problem_task = fetch_problem_intensity_signals(idea)
         trend_task = fetch_trend_demand_signals(query_bundle)
         competitor_task = fetch_competitor_signals(query_bundle)
 
@@ -242,7 +201,7 @@ async def evaluate_idea(
 
         # ── 8. Summary ───────────────────────────────────────────────────
         logger.info("Pipeline step 8: Generating summary")
-        summary = _generate_summary(scores)
+        summary = generate_summary(scores)
 
         # ── 9. Build report object ────────────────────────────────────
         report = IdeaEvaluationReport(
@@ -270,6 +229,14 @@ async def evaluate_idea(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Evaluation failed: {exc}",
         ) from exc
+    finally:
+        # Stop the task if we bailed early, then retrieve its outcome so an
+        # exception it already finished with is never reported as unretrieved.
+        # gather() collects the child's error or cancellation while still
+        # letting a cancellation of this handler propagate.
+        if not problem_task.done():
+            problem_task.cancel()
+        await asyncio.gather(problem_task, return_exceptions=True)
 
     # ── 11. Index evaluation data for RAG chat ─────────────────
     try:
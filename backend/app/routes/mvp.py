@@ -37,6 +37,17 @@ router = APIRouter(
 
 # ── Helpers ──────────────────────────────────────────────────────────────
 
+# Evaluation module scores passed straight through to the MVP generator
+_MODULE_SCORE_FIELDS: tuple[str, ...] = (
+    "problem_intensity",
+    "market_timing",
+    "competition_pressure",
+    "market_potential",
+    "execution_feasibility",
+    "final_viability_score",
+)
+
+
 def _record_to_response(record: MVPReport) -> MVPReportRecord:
     """Convert an MVPReport ORM instance to an MVPReportRecord response."""
     blueprint = None
@@ -132,6 +143,9 @@ async def generate_mvp(
             detail="Failed to parse stored evaluation report.",
         )
 
+    # Every module score the generator needs, neutral 50 when absent
+    scores = {name: module_scores.get(name, 50) for name in _MODULE_SCORE_FIELDS}
+
     # ── Parse competitors from market research ────────────────
     competitors = []
     competitor_count = int(mr.competitor_count) if mr.competitor_count else 0
@@ -176,12 +190,7 @@ async def generate_mvp(
             team_size=idea.team_size or 5,
             tech_complexity=idea.tech_complexity if idea.tech_complexity is not None else 0.5,
             regulatory_risk=idea.regulatory_risk if idea.regulatory_risk is not None else 0.5,
-            problem_intensity=module_scores.get("problem_intensity", 50),
-            market_timing=module_scores.get("market_timing", 50),
-            competition_pressure=module_scores.get("competition_pressure", 50),
-            market_potential=module_scores.get("market_potential", 50),
-            execution_feasibility=module_scores.get("execution_feasibility", 50),
-            final_viability_score=module_scores.get("final_viability_score", 50),
+            **scores,
             market_confidence=market_confidence,
             competitors=competitors,
             competitor_count=competitor_count,
@@ -40,6 +40,7 @@ from ..services.trend_agent import fetch_trend_demand_signals
 from ..services.competitor_agent import fetch_competitor_signals
 from ..services.normalization_engine import normalize_signals
 from ..services.scoring_engine import compute_scores
+from ..services.summary import generate_summary
 from ..services.vector_store import chunk_pitch_deck, index_chunks_async
 
 logger = logging.getLogger(__name__)
@@ -111,39 +112,7 @@ async def _run_evaluation(idea: Idea) -> tuple[ModuleScores, dict[str, str]]:
     )
     scores = compute_scores(normalized)
 
-    final = scores.final_viability_score
-    if final >= 75:
-        verdict = "Strong"
-    elif final >= 55:
-        verdict = "Moderate"
-    else:
-        verdict = "Weak"
-
-    if scores.competition_pressure < 40 or scores.execution_feasibility < 30:
-        risk_level = "High"
-    elif scores.competition_pressure < 60 or scores.execution_feasibility < 50:
-        risk_level = "Medium"
-    else:
-        risk_level = "Low"
-
-    module_map = {
-        "Problem Intensity": scores.problem_intensity,
-        "Market Timing": scores.market_timing,
-        "Competition Pressure": scores.competition_pressure,
-        "Market Potential": scores.market_potential,
-        "Execution Feasibility": scores.execution_feasibility,
-    }
-    key_strength = max(module_map, key=module_map.get)  # type: ignore[arg-type]
-    key_risk = min(module_map, key=module_map.get)  # type: ignore[arg-type]
-
-    summary = {
-        "verdict": verdict,
-        "risk_level": risk_level,
-        "key_strength": key_strength,
-        "key_risk": key_risk,
-    }
-
-    return scores, summary
+    return scores, generate_summary(scores)
 
 
 def _record_to_response(record: PitchDeck) -> PitchDeckRecord:
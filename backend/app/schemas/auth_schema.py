@@ -11,20 +11,21 @@ from pydantic import BaseModel, EmailStr, Field, field_validator
 # ---------------------------------------------------------------------------
 # Password policy
 # ---------------------------------------------------------------------------
-COMMON_PASSWORDS = {
+COMMON_PASSWORDS: frozenset[str] = frozenset({
     "password", "password1", "123456", "12345678", "123456789",
     "qwerty", "abc123", "letmein", "welcome", "admin",
     "monkey", "master", "dragon", "login", "princess",
     "football", "shadow", "sunshine", "trustno1", "iloveyou",
-}
+})
 
 _PW_MIN_LENGTH = 8
-_PW_RULES = [
-    (r"[A-Z]", "one uppercase letter"),
-    (r"[a-z]", "one lowercase letter"),
-    (r"[0-9]", "one number"),
-    (r"[!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>/?]", "one special character"),
-]
+_PW_RULES: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"[A-Z]"), "one uppercase letter"),
+    (re.compile(r"[a-z]"), "one lowercase letter"),
+    (re.compile(r"[0-9]"), "one number"),
+    (re.compile(r"[!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>/?]"), "one special character"),
+)
+_NON_LOWER_ALPHA_RE = re.compile(r"[^a-z]")
 
 
 def validate_password_strength(password: str) -> str:
@@ -33,11 +34,11 @@ def validate_password_strength(password: str) -> str:
     if len(password) < _PW_MIN_LENGTH:
         errors.append(f"at least {_PW_MIN_LENGTH} characters")
     for pattern, label in _PW_RULES:
-        if not re.search(pattern, password):
+        if not pattern.search(password):
             errors.append(label)
     # Check if the password (or its alphabetic core) is a common password
     pw_lower = password.lower()
-    pw_alpha = re.sub(r"[^a-z]", "", pw_lower)
+    pw_alpha = _NON_LOWER_ALPHA_RE.sub("", pw_lower)
     if pw_lower in COMMON_PASSWORDS or pw_alpha in COMMON_PASSWORDS:
         errors.append("not be a common password")
     if errors:
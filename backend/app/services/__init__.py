@@ -5,6 +5,7 @@ from .trend_agent import fetch_trend_demand_signals
 from .competitor_agent import fetch_competitor_signals
 from .normalization_engine import normalize_signals
 from .scoring_engine import compute_scores
+from .summary import generate_summary
 
 __all__ = [
     "create_idea",
@@ -14,4 +15,5 @@ __all__ = [
     "fetch_competitor_signals",
     "normalize_signals",
     "compute_scores",
+    "generate_summary",
 ]
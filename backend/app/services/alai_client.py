@@ -25,6 +25,9 @@ ALAI_API_KEY: str = os.getenv("ALAI_API_KEY", "")
 ALAI_BASE_URL: str = os.getenv("ALAI_BASE_URL", "https://slides-api.getalai.com/api/v1")
 ALAI_MAX_SLIDES: int = int(os.getenv("ALAI_MAX_SLIDES", "10"))
 
+_CREATE_TIMEOUT = httpx.Timeout(30.0)
+_POLL_TIMEOUT = httpx.Timeout(15.0)
+
 # ── Startup diagnostics ─────────────────────────────────────────────────
 print("🔐 [ALAI] API key loaded:", bool(ALAI_API_KEY))
 print("🌐 [ALAI] Base URL:", ALAI_BASE_URL)
@@ -88,7 +91,7 @@ async def generate_pitch_deck_via_alai(
     print(f"🚀 [ALAI] Generation started — title={deck_title}")
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=_CREATE_TIMEOUT) as client:
             response = await client.post(
                 f"{ALAI_BASE_URL}/generations",
                 headers={"Authorization": f"Bearer {ALAI_API_KEY}"},
@@ -123,7 +126,7 @@ async def generate_pitch_deck_via_alai(
     status_json: dict[str, Any] = {}
     completed = False
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
+    async with httpx.AsyncClient(timeout=_POLL_TIMEOUT) as client:
         for poll_attempt in range(20):  # max ~60 seconds
             try:
                 status_response = await client.get(
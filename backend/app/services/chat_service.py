@@ -21,7 +21,9 @@ import os
 from typing import Any, Dict, List
 
 import httpx
+import orjson
 
+from .http_client import get_http_client
 from .vector_store import embed_single, embed_single_async, query_by_idea, get_indexed_agents
 
 logger = logging.getLogger(__name__)
@@ -33,7 +35,7 @@ _OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
 _CHAT_MODEL = "gpt-4.1"
 _CHAT_TEMPERATURE = 0.6
 _CHAT_MAX_TOKENS = 900
-_CHAT_TIMEOUT = 40.0
+_CHAT_TIMEOUT = httpx.Timeout(40.0)
 _TOP_K = 5
 
 _SYSTEM_PROMPT = (
@@ -177,12 +179,12 @@ async def ask_co_founder(
 
     try:
         print(f"💬 [CHAT] Calling {_CHAT_MODEL} for idea {idea_id[:8]}...")
-        async with httpx.AsyncClient(timeout=_CHAT_TIMEOUT) as client:
-            response = await client.post(
-                _OPENAI_CHAT_URL,
-                headers=headers,
-                json=payload,
-            )
+        response = await get_http_client().post(
+            _OPENAI_CHAT_URL,
+            headers=headers,
+            json=payload,
+            timeout=_CHAT_TIMEOUT,
+        )
 
         if response.status_code != 200:
             logger.error("[CHAT] LLM error %d: %s", response.status_code, response.text[:300])
@@ -192,7 +194,7 @@ async def ask_co_founder(
                 "indexed_agents": indexed,
             }
 
-        data = response.json()
+        data = orjson.loads(response.content)
         answer = (data["choices"][0]["message"]["content"] or "").strip()
 
         usage = data.get("usage", {})
@@ -16,16 +16,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import os
+import random
 import re
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import chain
 from typing import Dict, List, Any, Optional
 
 import httpx
+import orjson
 
 from ..schemas.query_schema import QueryBundle
 from ..schemas.competitor_schema import CompetitorSignals
-from .competitor_cleaner import clean_competitors, hard_filter_candidates
+from .competitor_cleaner import clean_competitors, extract_domain, is_excluded_domain
+from .http_client import get_http_client
+from .search_cache import get_cached_async, set_cached_async
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +40,19 @@ logger = logging.getLogger(__name__)
 # Exa API configuration
 # ---------------------------------------------------------------------------
 _EXA_API_URL = "https://api.exa.ai/search"
-_REQUEST_TIMEOUT = 10.0  # seconds per request
+_REQUEST_TIMEOUT = httpx.Timeout(10.0)  # seconds per request
 _MAX_RETRIES = 1
 _INITIAL_BACKOFF = 1.0  # seconds
+_MAX_BACKOFF = 8.0  # seconds — also caps a server-sent Retry-After
 _RESULTS_PER_QUERY = 10  # top results per query
+# Only the first 500 chars of page text are ever read (descriptions), so
+# have Exa truncate server-side instead of shipping whole pages.
+_TEXT_MAX_CHARACTERS = 500
+
+# Cap on in-flight Exa requests across all concurrent evaluations; an
+# uncapped gather of every query trips Exa's rate limit (HTTP 429).
+_MAX_CONCURRENT_REQUESTS = 4
+_EXA_SEMAPHORE = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
 
 # ---------------------------------------------------------------------------
 # Stop-words for noun extraction (feature overlap computation).
@@ -90,63 +106,48 @@ def _get_exa_key() -> str:
     return key
 
 
-def _extract_domain(url: str) -> str:
-    """Return the bare domain from a URL (e.g. 'example.com')."""
-    match = re.search(r"https?://(?:www\.)?([^/]+)", url.lower())
-    return match.group(1) if match else ""
-
-
 _EXCLUDED_URL_PATTERNS: tuple[str, ...] = (
     "/blog", "/news", "/article", "/press", "/media",
     "/resources/", "/insights/", "/learn/", "/guides/",
 )
+_EXCLUDED_URL_RE = re.compile("|".join(map(re.escape, _EXCLUDED_URL_PATTERNS)))
 
 
-def _is_excluded(url: str) -> bool:
-    """Return True if the URL belongs to an excluded domain or path."""
-    domain = _extract_domain(url)
-    if any(excl in domain for excl in _EXCLUDED_DOMAINS):
-        return True
-    url_lower = url.lower()
-    return any(pat in url_lower for pat in _EXCLUDED_URL_PATTERNS)
-
+def _is_excluded(url: str, domain: str) -> bool:
+    """Return True if the URL belongs to an excluded domain or path.
 
-def _extract_company_name(title: str, url: str) -> str:
-    """Best-effort company name from the page title or domain."""
-    if title:
-        # Take the first segment before common separators
-        parts = re.split(r"[\|\-\u2013\u2014:]", title)
-        if parts:
-            name = parts[0].strip()
-            # Remove parenthetical suffixes
-            name = re.sub(r"\s*\(.*?\)\s*", "", name)
-            if 2 < len(name) < 60:
-                return name
+    *domain* is the already-extracted domain of *url*.
+    """
+    if is_excluded_domain(domain, _EXCLUDED_DOMAINS):
+        return True
+    return _EXCLUDED_URL_RE.search(url.lower()) is not None
 
-    # Fallback: capitalised domain root
-    domain = _extract_domain(url)
-    if domain:
-        root = domain.split(".")[0]
-        return root.title()
 
-    return "Unknown"
+# ---------------------------------------------------------------------------
+# Precompiled patterns for attribute extraction
+# ---------------------------------------------------------------------------
+# In priority order: an explicit founded/established year wins over "since".
+_FOUNDING_YEAR_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(
+        r"(?:founded|established|started|launched|est\.?)\s*(?:in\s*)?(?P<year>\d{4})",
+        re.IGNORECASE,
+    ),
+    re.compile(r"since\s+(?P<year>\d{4})", re.IGNORECASE),
+)
+_NON_ALPHA_RE = re.compile(r"[^a-zA-Z]+")
 
 
 def _extract_founding_year(text: str) -> Optional[int]:
     """Try to find a 4-digit founding year in *text*.
 
-    Looks for patterns like "founded in 2018", "est. 2015", "since 2020".
+    Looks for patterns like "founded in 2018", "est. 2015", "since 2020",
+    trying each pattern in priority order and skipping implausible years.
     Returns None if nothing plausible is found.
     """
-    patterns = [
-        r"(?:founded|established|started|launched|est\.?)\s*(?:in\s*)?(\d{4})",
-        r"since\s+(\d{4})",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            year = int(match.group(1))
-            current_year = datetime.now().year
+    current_year = datetime.now().year
+    for pattern in _FOUNDING_YEAR_PATTERNS:
+        for match in pattern.finditer(text):
+            year = int(match["year"])
             if 1990 <= year <= current_year:
                 return year
     return None
@@ -157,7 +158,7 @@ def _tokenise_nouns(text: str) -> set[str]:
 
     This is a lightweight noun-proxy used for Jaccard overlap computation.
     """
-    tokens = re.split(r"[^a-zA-Z]+", text.lower())
+    tokens = _NON_ALPHA_RE.split(text.lower())
     return {
         t for t in tokens
         if len(t) >= 3 and t not in _STOP_WORDS
@@ -173,6 +174,8 @@ _TITLE_BLACKLIST_PHRASES: tuple[str, ...] = (
     "review", "comparison", "tutorial", "explained",
     "definition", "meaning", "overview",
 )
+# All phrases folded into one alternation — a single scan per title
+_TITLE_BLACKLIST_RE = re.compile("|".join(map(re.escape, _TITLE_BLACKLIST_PHRASES)))
 
 _TITLE_BLACKLIST_SUFFIXES: tuple[str, ...] = (
     "software", "platform", "industry", "law", "legaltech",
@@ -193,24 +196,48 @@ def is_valid_competitor(title: str, domain: str) -> bool:
 
     title_lower = title.lower().strip()
 
-    for phrase in _TITLE_BLACKLIST_PHRASES:
-        if phrase in title_lower:
-            return False
-
-    for suffix in _TITLE_BLACKLIST_SUFFIXES:
-        if title_lower.endswith(suffix):
-            return False
+    if _TITLE_BLACKLIST_RE.search(title_lower):
+        return False
 
-    return True
+    # str.endswith accepts the whole tuple — one C-level call
+    return not title_lower.endswith(_TITLE_BLACKLIST_SUFFIXES)
 
 
 def _jaccard(set_a: set[str], set_b: set[str]) -> float:
-    """Jaccard similarity between two sets, returns 0.0 if both empty."""
+    """Jaccard similarity between two sets, returns 0.0 if both empty.
+
+    |A ∪ B| is derived from the set sizes (|A| + |B| − |A ∩ B|), so only the
+    intersection is materialised.
+    """
     if not set_a and not set_b:
         return 0.0
-    intersection = set_a & set_b
-    union = set_a | set_b
-    return len(intersection) / len(union)
+    shared = len(set_a & set_b)
+    return shared / (len(set_a) + len(set_b) - shared)
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before retry *attempt* + 1.
+
+    Honours a ``Retry-After`` header in either delta-seconds or HTTP-date
+    form (capped at ``_MAX_BACKOFF``); a missing or unparseable header
+    falls back to exponential backoff with equal jitter so parallel queries
+    do not retry in lockstep.
+    """
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+                if when.tzinfo is None:  # "-0000" zone: UTC per RFC 5322
+                    when = when.replace(tzinfo=timezone.utc)
+                seconds = (when - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                seconds = math.nan
+        if not math.isnan(seconds):
+            return min(max(seconds, 0.0), _MAX_BACKOFF)
+    base = min(_INITIAL_BACKOFF * (2 ** attempt), _MAX_BACKOFF)
+    return random.uniform(0.5, 1.0) * base
 
 
 async def _search_exa(api_key: str, query: str) -> List[Dict[str, Any]]:
@@ -227,25 +254,33 @@ async def _search_exa(api_key: str, query: str) -> List[Dict[str, Any]]:
         "type": "auto",
         "numResults": _RESULTS_PER_QUERY,
         "contents": {
-            "text": True,
+            "text": {"maxCharacters": _TEXT_MAX_CHARACTERS},
             "highlights": True,
         },
     }
 
     print(f"🔎 [EXA] Searching: {query!r}")
 
+    cached = await get_cached_async("exa", payload)
+    if cached is not None:
+        print(f"💾 [EXA] Cache hit: {len(cached)} results for query={query!r}")
+        return cached
+
     for attempt in range(_MAX_RETRIES + 1):
+        retry_after: Optional[str] = None
         try:
-            async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT) as client:
-                response = await client.post(
+            async with _EXA_SEMAPHORE:
+                response = await get_http_client().post(
                     _EXA_API_URL,
                     headers=headers,
                     json=payload,
+                    timeout=_REQUEST_TIMEOUT,
                 )
             print(f"📦 [EXA] HTTP {response.status_code} for query={query!r}")
             if response.status_code == 200:
-                results = response.json().get("results", [])
+                results = orjson.loads(response.content).get("results", [])
                 print(f"📄 [EXA] Raw results count: {len(results)} for query={query!r}")
+                await set_cached_async("exa", payload, results)
                 return results
 
             if response.status_code in (400, 401, 402, 403, 404):
@@ -257,6 +292,9 @@ async def _search_exa(api_key: str, query: str) -> List[Dict[str, Any]]:
                 )
                 return []
 
+            # 429 / 5xx — retryable
+            retry_after = response.headers.get("Retry-After")
+
         except httpx.TimeoutException:
             print(f"⚠️ [EXA] Timeout (attempt {attempt + 1}) for query={query!r}")
             logger.warning(
@@ -268,7 +306,7 @@ async def _search_exa(api_key: str, query: str) -> List[Dict[str, Any]]:
             return []
 
         if attempt < _MAX_RETRIES:
-            await asyncio.sleep(_INITIAL_BACKOFF * (2 ** attempt))
+            await asyncio.sleep(_retry_delay(attempt, retry_after))
 
     print(f"⚠️ [EXA] All retries exhausted for query={query!r}")
     return []
@@ -331,11 +369,13 @@ async def fetch_competitor_signals(query_bundle: QueryBundle) -> CompetitorSigna
         if not url:
             continue
 
-        if _is_excluded(url):
+        # Extract the domain once and run the O(1) dedup check before the
+        # exclusion scans — repeat domains are common across the 5 queries.
+        domain = extract_domain(url)
+        if domain in seen_domains:
             continue
 
-        domain = _extract_domain(url)
-        if domain in seen_domains:
+        if _is_excluded(url, domain):
             continue
         seen_domains.add(domain)
 
@@ -373,34 +413,33 @@ async def fetch_competitor_signals(query_bundle: QueryBundle) -> CompetitorSigna
     # ------------------------------------------------------------------ #
     total_competitors = len(competitors)
 
-    # avg_company_age — only from competitors with a detected founding year
-    current_year = datetime.now().year
-    ages: List[float] = []
-    for comp in competitors:
-        if comp["founding_year"] is not None:
-            age = current_year - comp["founding_year"]
-            if age >= 0:
-                ages.append(float(age))
-    avg_age = sum(ages) / len(ages) if ages else 0.0
-
     # competitor_density_score
     density = min(total_competitors / 20.0, 1.0)
 
-    # feature_overlap_score — Jaccard of competitor description nouns
-    # vs. the union of industry_tags + core_keywords
-    reference_tokens: set[str] = set()
-    for tag in query_bundle.industry_tags:
-        reference_tokens.update(_tokenise_nouns(tag))
-    for kw in query_bundle.core_keywords:
-        reference_tokens.update(_tokenise_nouns(kw))
+    # Single pass over competitors accumulating both per-competitor metrics:
+    #   avg_company_age       — only competitors with a detected founding year
+    #   feature_overlap_score — Jaccard of competitor description nouns
+    #                           vs. the union of industry_tags + core_keywords
+    reference_tokens = _tokenise_nouns(
+        " ".join(chain(query_bundle.industry_tags, query_bundle.core_keywords))
+    )
+    current_year = datetime.now().year
+    age_sum, age_count = 0.0, 0
+    overlap_sum, overlap_count = 0.0, 0
 
-    overlaps: List[float] = []
     for comp in competitors:
+        founding_year = comp["founding_year"]
+        if founding_year is not None and founding_year <= current_year:
+            age_sum += current_year - founding_year
+            age_count += 1
+
         comp_tokens = _tokenise_nouns(comp["description"])
         if comp_tokens:
-            overlaps.append(_jaccard(comp_tokens, reference_tokens))
+            overlap_sum += _jaccard(comp_tokens, reference_tokens)
+            overlap_count += 1
 
-    avg_overlap = sum(overlaps) / len(overlaps) if overlaps else 0.0
+    avg_age = age_sum / age_count if age_count else 0.0
+    avg_overlap = overlap_sum / overlap_count if overlap_count else 0.0
     feature_overlap = max(0.0, min(1.0, avg_overlap))
 
     print(f"🏢 [COMP] Competitors normalized: {len(unique_names)} — {unique_names}")
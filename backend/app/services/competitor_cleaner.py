@@ -11,7 +11,9 @@ from __future__ import annotations
 import json
 import logging
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
 
 from .openai_client import call_openai_chat_async
 
@@ -62,24 +64,82 @@ EXCLUDED_TITLE_PHRASES: tuple[str, ...] = (
     "forecast", "trends", "outlook", "ranking",
 )
 
+# ── Precompiled single-pass matchers for the tuples above ─────────────────
+# Plain substring semantics are kept (no word boundaries): several phrases
+# carry their own trailing space ("top ", "vs ") and bare stems such as
+# "guide" are meant to match "guides".
+_URL_PATTERN_RE = re.compile("|".join(map(re.escape, EXCLUDED_URL_PATTERNS)))
+_TITLE_PHRASE_RE = re.compile("|".join(map(re.escape, EXCLUDED_TITLE_PHRASES)))
+
+# ── Precompiled helpers for company-name extraction ──────────────────────
+_TITLE_SEPARATOR_RE = re.compile(r"[\|\-\u2013\u2014:]")
+_PARENTHETICAL_RE = re.compile(r"\s*\(.*?\)\s*")
+
 
 # ===================================================================== #
-#  Step 1 — Extract domain                                                #
+#  Step 1 — Extract domain / name (shared by both competitor agents)      #
 # ===================================================================== #
 
-def _extract_domain(url: str) -> str:
-    match = re.search(r"https?://(?:www\.)?([^/]+)", url.lower())
-    return match.group(1) if match else ""
+@lru_cache(maxsize=4096)
+def extract_domain(url: str) -> str:
+    """Return the bare domain from a URL (e.g. 'example.com')."""
+    try:
+        parts = urlsplit(url)
+        host = parts.hostname or ""
+    except ValueError:
+        return ""
+    if parts.scheme.lower() not in ("http", "https"):
+        return ""
+    return host.removeprefix("www.")
+
+
+def is_excluded_domain(
+    domain: str,
+    excluded: frozenset[str] = EXCLUDED_DOMAINS,
+) -> bool:
+    """Return True if *domain* or any parent domain is in *excluded*.
+
+    Matching is exact per label boundary, so "blog.medium.com" is excluded
+    via "medium.com" while "dropbox.com" no longer matches "x.com".
+    Regional variants that append a two-letter country code to an excluded
+    domain ("forbes.com.au", "uk.businessinsider.com.mx") are excluded too.
+    """
+    host = domain.partition(":")[0].rstrip(".")
+    base, _, tld = host.rpartition(".")
+    hosts = (host, base) if len(tld) == 2 and "." in base else (host,)
+    for host in hosts:
+        while host:
+            if host in excluded:
+                return True
+            _, _, host = host.partition(".")
+    return False
 
 
 def _domain_root(url: str) -> str:
     """Get the root name from a domain (e.g. 'stripe' from 'stripe.com')."""
-    domain = _extract_domain(url)
+    domain = extract_domain(url)
     if domain:
         return domain.split(".")[0].title()
     return ""
 
 
+@lru_cache(maxsize=4096)
+def extract_company_name(title: str, url: str) -> str:
+    """Best-effort company name from the page title or domain."""
+    if title:
+        # Take the first segment before common separators
+        parts = _TITLE_SEPARATOR_RE.split(title)
+        if parts:
+            name = parts[0].strip()
+            # Remove parenthetical suffixes
+            name = _PARENTHETICAL_RE.sub("", name)
+            if 2 < len(name) < 60:
+                return name
+
+    # Fallback: capitalised domain root
+    return _domain_root(url) or "Unknown"
+
+
 # ===================================================================== #
 #  Step 2 — Hard filter (before LLM)                                      #
 # ===================================================================== #
@@ -96,29 +156,29 @@ def hard_filter_candidates(
         if not url:
             continue
 
+        # Cheapest checks first: an already-accepted domain skips the scans
+        domain = extract_domain(url)
+        if domain in seen_domains:
+            continue
+
         # Domain exclusion
-        domain = _extract_domain(url)
-        if any(excl in domain for excl in EXCLUDED_DOMAINS):
+        if is_excluded_domain(domain):
             continue
 
         # URL path exclusion
-        url_lower = url.lower()
-        if any(pat in url_lower for pat in EXCLUDED_URL_PATTERNS):
+        if _URL_PATTERN_RE.search(url.lower()):
             continue
 
         # Deduplicate by domain
-        if domain in seen_domains:
-            continue
         seen_domains.add(domain)
 
-        # Title exclusion
+        # Reject very long titles (likely article headlines)
         title = (result.get("title") or "").strip()
-        title_lower = title.lower()
-        if any(phrase in title_lower for phrase in EXCLUDED_TITLE_PHRASES):
+        if len(title) > 60:
             continue
 
-        # Reject very long titles (likely article headlines)
-        if len(title) > 60:
+        # Title exclusion
+        if _TITLE_PHRASE_RE.search(title.lower()):
             continue
 
         survivors.append({
@@ -230,12 +290,12 @@ def _parse_competitor_json(result: Optional[Dict[str, Any]]) -> Optional[List[st
 #  Step 4 — Final safety check                                            #
 # ===================================================================== #
 
-_NAME_STRIP_SUFFIXES = {
+_NAME_STRIP_SUFFIXES: frozenset[str] = frozenset({
     "inc", "ltd", "llc", "corp", "corporation", "co",
     "ai", "platform", "software", "solutions", "services",
     "tool", "tools", "app", "apps", "technology", "technologies",
     "group", "global", "labs", "studio", "studios",
-}
+})
 
 
 def _clean_name(name: str) -> Optional[str]:
@@ -245,21 +305,25 @@ def _clean_name(name: str) -> Optional[str]:
         return None
 
     # Strip parenthetical
-    name = re.sub(r"\s*\(.*?\)\s*", " ", name).strip()
+    name = _PARENTHETICAL_RE.sub(" ", name).strip()
 
     words = name.split()
 
-    # Strip suffix words
-    while words and words[-1].lower().rstrip(".,") in _NAME_STRIP_SUFFIXES:
-        words.pop()
-    while words and words[0].lower().rstrip(".,") in _NAME_STRIP_SUFFIXES:
-        words.pop(0)
-
-    if not words:
+    # Strip suffix words — each word is case-folded once, then trimmed
+    # from both ends by index instead of repeated pop(0)
+    keys = [w.lower().rstrip(".,") for w in words]
+    end = len(words)
+    while end and keys[end - 1] in _NAME_STRIP_SUFFIXES:
+        end -= 1
+    start = 0
+    while start < end and keys[start] in _NAME_STRIP_SUFFIXES:
+        start += 1
+
+    if start == end:
         return None
 
     # Max 2 words
-    words = words[:2]
+    words = words[start:min(end, start + 2)]
 
     # Proper capitalization
     result = " ".join(w.capitalize() if w.islower() else w for w in words)
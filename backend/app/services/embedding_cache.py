@@ -0,0 +1,114 @@
+"""On-disk cache for OpenAI embedding vectors.
+
+Embeddings are a pure function of (model, text), so a vector computed once
+never needs to be paid for again: re-indexing an idea's agent outputs, or a
+repeated chat question, is served from a small SQLite file instead of the
+embeddings API.
+
+Keys are a 16-byte BLAKE2b digest of the model name and the exact input
+text.  Entries never expire — a different model produces different keys.
+
+Vectors are stored packed as native float32 (4 bytes per dimension, the
+same precision ChromaDB indexes with) rather than as JSON text, which is
+roughly 5x smaller on disk and needs no parsing on a hit.
+
+Configuration (read on first use, after ``.env`` is loaded):
+  EMBEDDING_CACHE_PATH — SQLite file (default ./embedding_cache.sqlite3)
+
+Cache failures are logged and treated as misses; they never break indexing
+or chat.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from typing import List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+_DEFAULT_PATH = "./embedding_cache.sqlite3"
+
+# SQLite's default host-parameter limit is 999 on older builds.
+_MAX_PARAMS_PER_QUERY = 900
+
+# ---------------------------------------------------------------------------
+# Singleton SQLite connection
+# ---------------------------------------------------------------------------
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Return the singleton SQLite connection (creates the table if missing)."""
+    global _conn
+    if _conn is None:
+        path = os.getenv("EMBEDDING_CACHE_PATH", _DEFAULT_PATH)
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings_f32 ("
+            " key BLOB PRIMARY KEY,"
+            " vector BLOB NOT NULL)"
+        )
+        _conn = conn
+        print(f"💾 [CACHE] Embedding cache initialized at {path}")
+    return _conn
+
+
+def _cache_key(model: str, text: str) -> bytes:
+    return hashlib.blake2b(f"{model}\0{text}".encode(), digest_size=16).digest()
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def get_cached_embeddings(
+    model: str,
+    texts: Sequence[str],
+) -> List[Optional[List[float]]]:
+    """Return one cached vector (or None on miss) per input text, in order."""
+    keys = [_cache_key(model, t) for t in texts]
+    found: dict[bytes, bytes] = {}
+    try:
+        with _lock:
+            conn = _get_connection()
+            for start in range(0, len(keys), _MAX_PARAMS_PER_QUERY):
+                batch = keys[start:start + _MAX_PARAMS_PER_QUERY]
+                placeholders = ",".join("?" * len(batch))
+                found.update(conn.execute(
+                    f"SELECT key, vector FROM embeddings_f32 WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall())
+    except sqlite3.Error as exc:
+        logger.warning("[CACHE] Embedding read failed: %s", exc)
+        return [None] * len(texts)
+    return [array("f", found[k]).tolist() if k in found else None for k in keys]
+
+
+def set_cached_embeddings(
+    model: str,
+    texts: Sequence[str],
+    vectors: Sequence[List[float]],
+) -> None:
+    """Store *vectors* for *texts* (same order, same length)."""
+    rows = [
+        (_cache_key(model, t), array("f", v).tobytes())
+        for t, v in zip(texts, vectors)
+    ]
+    try:
+        with _lock:
+            _get_connection().executemany(
+                "INSERT OR REPLACE INTO embeddings_f32 (key, vector) VALUES (?, ?)",
+                rows,
+            )
+    except sqlite3.Error as exc:
+        logger.warning("[CACHE] Embedding write failed: %s", exc)
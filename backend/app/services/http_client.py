@@ -0,0 +1,52 @@
+"""Shared async HTTP client for outbound API calls.
+
+One process-wide ``httpx.AsyncClient`` is reused by the agents instead of
+opening a fresh client (and TLS handshake) per request.  HTTP/2 is enabled
+so concurrent calls to the same host — e.g. embeddings and chat
+completions on api.openai.com — multiplex over a single connection.
+
+Timeouts stay per-call: every caller passes its own ``timeout=``.
+
+The client is created lazily inside the running event loop and closed by
+the FastAPI lifespan hook via ``close_http_client()``.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+# ---------------------------------------------------------------------------
+# Connection pool configuration
+# ---------------------------------------------------------------------------
+# Idle connections are kept for a minute so the sequential agent stages of
+# one evaluation (Exa → Tavily → SerpAPI → OpenAI) reuse warm connections.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# ---------------------------------------------------------------------------
+# Singleton client
+# ---------------------------------------------------------------------------
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient (creates it on first use)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(http2=True, limits=_POOL_LIMITS)
+        print("🌐 [HTTP] Shared HTTP/2 client initialized")
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client — called once on application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        print("🌐 [HTTP] Shared HTTP/2 client closed")
@@ -16,9 +16,12 @@ STRICT RULES:
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
-from .openai_client import call_openai_chat_async, get_openai_key, validate_required_keys
+from .openai_client import call_openai_chat_async, get_openai_key, get_openai_model, validate_required_keys
+from .search_cache import get_cached_async, set_cached_async
 from ..constants import TECH_COMPLEXITY_MAP, REGULATORY_RISK_MAP, DEFAULT_PRICING, DEFAULT_PRICING_FALLBACK
 
 
@@ -98,6 +101,20 @@ async def infer_idea_attributes(
         print("⚠️  [INFERENCE] No OpenAI key — using defaults")
         return _default_inference()
 
+    # Opt-in exact-match cache (INFERENCE_CACHE_TTL_HOURS, off by default): the
+    # same idea (modulo case / whitespace) re-evaluated within the TTL reuses
+    # the earlier inference instead of a new LLM call.
+    cache_request = {
+        "model": get_openai_model(),
+        "description": " ".join(description.lower().split()),
+        "industry": industry,
+        "target_customer_type": target_customer_type,
+    }
+    cached = await get_cached_async("inference", cache_request)
+    if cached is not None:
+        print(f"💾 [INFERENCE] Cache hit: revenue_model={cached.get('revenue_model')}")
+        return cached
+
     user_prompt = _build_user_prompt(
         description=description,
         industry=industry,
@@ -151,6 +168,7 @@ async def infer_idea_attributes(
     print(f"✅ [INFERENCE] problem_keywords={result['core_problem_keywords']}")
     print(f"✅ [INFERENCE] market_keywords={result['market_keywords']}")
 
+    await set_cached_async("inference", cache_request, result)
     return result
 
 
@@ -175,34 +193,43 @@ def map_revenue_model_to_pricing(revenue_model: str) -> float:
     return DEFAULT_PRICING.get(revenue_model, DEFAULT_PRICING_FALLBACK)
 
 
+# ── Revenue model aliases → calculator categories ──────────────────────
+# Built once at import.  Order matters for the fuzzy fallback: more
+# specific aliases ("marketplace fee") precede their stems ("marketplace").
+_REVENUE_MODEL_ALIASES: Mapping[str, str] = MappingProxyType({
+    "subscription": "Subscription",
+    "saas": "Subscription",
+    "one-time": "One-time",
+    "one time": "One-time",
+    "marketplace fee": "Marketplace Fee",
+    "marketplace": "Marketplace Fee",
+    "ads": "Ads",
+    "advertising": "Ads",
+    "freemium": "Subscription",
+    "usage-based": "Subscription",
+    "usage based": "Subscription",
+    "licensing": "One-time",
+    "transaction fee": "Marketplace Fee",
+    "transaction": "Marketplace Fee",
+})
+_REVENUE_MODEL_ALIAS_ITEMS: tuple[tuple[str, str], ...] = tuple(_REVENUE_MODEL_ALIASES.items())
+
+
+@lru_cache(maxsize=1024)
 def normalize_revenue_model(raw: str) -> str:
     """Normalize the LLM-inferred revenue model to a known category.
 
-    Falls back to 'Subscription' if unrecognized.
+    Falls back to 'Subscription' if unrecognized.  Memoised: the LLM emits
+    a small set of phrasings, so the fuzzy fallback runs once per phrasing
+    (and an unknown value is only warned about the first time).
     """
     raw_lower = raw.strip().lower()
-    mapping = {
-        "subscription": "Subscription",
-        "saas": "Subscription",
-        "one-time": "One-time",
-        "one time": "One-time",
-        "marketplace fee": "Marketplace Fee",
-        "marketplace": "Marketplace Fee",
-        "ads": "Ads",
-        "advertising": "Ads",
-        "freemium": "Subscription",
-        "usage-based": "Subscription",
-        "usage based": "Subscription",
-        "licensing": "One-time",
-        "transaction fee": "Marketplace Fee",
-        "transaction": "Marketplace Fee",
-    }
-    normalized = mapping.get(raw_lower)
+    normalized = _REVENUE_MODEL_ALIASES.get(raw_lower)
     if normalized:
         return normalized
 
-    # Fuzzy fallback: check if any known key is a substring
-    for key, val in mapping.items():
+    # Fuzzy fallback: check if any known key is a substring (table order)
+    for key, val in _REVENUE_MODEL_ALIAS_ITEMS:
         if key in raw_lower:
             return val
 
@@ -25,7 +25,11 @@ def _clamp(value: float, lo: float = 0.0, hi: float = 100.0) -> float:
     """Clamp *value* to [lo, hi].  Treats None as 0."""
     if value is None:
         return lo
-    return max(lo, min(hi, value))
+    # Same semantics as max(lo, min(hi, value)), NaN included, without
+    # the two builtin calls.
+    if value < lo:
+        return lo
+    return value if value <= hi else hi
 
 
 # ---------------------------------------------------------------------------
@@ -97,40 +101,28 @@ def normalize_signals(
     pain_intensity = _clamp(raw_pain)
     print(f"📊 [Normalization] Pain intensity: {pain_intensity} (from Problem Intensity Agent, confidence={problem.confidence_level})")
 
-    # 2. demand_strength  (trend.demand_strength_score is 0-1)
-    raw_demand = trend.demand_strength_score
-    if not trend_available:
-        demand_strength = _MISSING_SIGNAL_DEFAULT
-        print(f"📊 [Normalization] Demand strength: no trend data → default {_MISSING_SIGNAL_DEFAULT}")
-    else:
-        demand_strength = _clamp(raw_demand * 100)
-
-    # 3. market_growth — tiered mapping (replaces soft saturation that inflated to 100)
+    # 2-4. Trend-derived market signals — availability is checked once
+    raw_demand = trend.demand_strength_score       # 0-1
     raw_growth = trend.growth_rate_5y
-    if not trend_available:
-        market_growth = _MISSING_SIGNAL_DEFAULT
-        print(f"📈 [Normalization] Market growth: no trend data → default {_MISSING_SIGNAL_DEFAULT}")
-    else:
+    raw_momentum = trend.momentum_score            # 0-1
+    if trend_available:
+        demand_strength = _clamp(raw_demand * 100)
+        # Tiered mapping (replaces soft saturation that inflated to 100)
         market_growth = _growth_rate_to_score(raw_growth)
+        market_momentum = _clamp(raw_momentum * 100)
+    else:
+        # ── Low-confidence: no trend data → neutral default, capped ──
+        demand_strength = market_growth = market_momentum = min(
+            _MISSING_SIGNAL_DEFAULT, _LOW_CONFIDENCE_CAP
+        )
+        print(
+            f"📥 [Normalization] Trend data MISSING → demand, growth and momentum "
+            f"default to {demand_strength} (cap {_LOW_CONFIDENCE_CAP})"
+        )
 
     print(f"📈 [Normalization] Raw growth: {raw_growth}")
     print(f"📈 [Normalization] Normalized market growth: {round(market_growth, 2)}")
 
-    # 4. market_momentum  (trend.momentum_score is 0-1)
-    raw_momentum = trend.momentum_score
-    if not trend_available:
-        market_momentum = _MISSING_SIGNAL_DEFAULT
-        print(f"📊 [Normalization] Market momentum: no trend data → default {_MISSING_SIGNAL_DEFAULT}")
-    else:
-        market_momentum = _clamp(raw_momentum * 100)
-
-    # ── Low-confidence cap: if trend data is missing, cap market signals ──
-    if not trend_available:
-        demand_strength = min(demand_strength, _LOW_CONFIDENCE_CAP)
-        market_growth = min(market_growth, _LOW_CONFIDENCE_CAP)
-        market_momentum = min(market_momentum, _LOW_CONFIDENCE_CAP)
-        print(f"📥 [Normalization] Trend data MISSING → capping market signals at {_LOW_CONFIDENCE_CAP}")
-
     # 5. competition_density  (competitor.competitor_density_score is 0-1)
     raw_comp_density = competitor.competitor_density_score
     competition_density = _clamp(raw_comp_density * 100)
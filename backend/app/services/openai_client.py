@@ -11,12 +11,16 @@ This ensures:
 
 from __future__ import annotations
 
-import json
 import os
+import re
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
+
+from .http_client import get_http_client
 
 # ---------------------------------------------------------------------------
 # Constants — all read from environment with safe defaults
@@ -56,8 +60,10 @@ def _get_temperature() -> float:
     return _env_float("OPENAI_TEMPERATURE", 0.7)
 
 
-def _get_timeout() -> float:
-    return _env_float("OPENAI_REQUEST_TIMEOUT", 40.0)
+@lru_cache(maxsize=1)
+def _get_timeout() -> httpx.Timeout:
+    # Built lazily on first call (after main has loaded .env), then reused.
+    return httpx.Timeout(_env_float("OPENAI_REQUEST_TIMEOUT", 40.0))
 
 
 def _get_default_max_tokens() -> int:
@@ -67,6 +73,9 @@ def _get_default_max_tokens() -> int:
 # ---------------------------------------------------------------------------
 # JSON sanitizer — extracts valid JSON from LLM output
 # ---------------------------------------------------------------------------
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
 def sanitize_json(raw: str) -> str:
     """Extract a JSON object from raw LLM output.
 
@@ -78,8 +87,6 @@ def sanitize_json(raw: str) -> str:
 
     Raises ValueError if no JSON object is found.
     """
-    import re
-
     text = raw.strip().lstrip("\ufeff")
 
     # 1. Strip markdown fences
@@ -110,7 +117,7 @@ def sanitize_json(raw: str) -> str:
     text = text[: rbrace_idx + 1]
 
     # 5. Remove trailing commas before } or ]
-    text = re.sub(r",\s*([}\]])", r"\1", text)
+    text = _TRAILING_COMMA_RE.sub(r"\1", text)
 
     return text
 
@@ -227,7 +234,7 @@ def call_openai_chat(
                     continue
                 return None
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Log token usage if available
             usage = data.get("usage")
@@ -253,11 +260,11 @@ def call_openai_chat(
                     continue
                 return None
 
-            parsed = json.loads(sanitized)
+            parsed = orjson.loads(sanitized)
             print("🧠 [OPENAI] Success")
             return parsed
 
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             print(f"❌ [OPENAI] JSON parse failed — retrying: {exc}")
             if attempt < max_retries:
                 continue
@@ -315,12 +322,12 @@ async def call_openai_chat_async(
         t0 = time.time()
         try:
             print(f"🧠 [OPENAI] Calling {model} (attempt {attempt + 1}/{max_retries + 1})")
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    _OPENAI_API_URL,
-                    headers=headers,
-                    json=payload,
-                )
+            response = await get_http_client().post(
+                _OPENAI_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=timeout,
+            )
             duration = time.time() - t0
             print(f"📦 [OPENAI] HTTP {response.status_code} ({duration:.1f}s)")
 
@@ -332,7 +339,7 @@ async def call_openai_chat_async(
                     continue
                 return None
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             usage = data.get("usage")
             if usage:
@@ -356,11 +363,11 @@ async def call_openai_chat_async(
                     continue
                 return None
 
-            parsed = json.loads(sanitized)
+            parsed = orjson.loads(sanitized)
             print("🧠 [OPENAI] Success")
             return parsed
 
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             print(f"❌ [OPENAI] JSON parse failed — retrying: {exc}")
             if attempt < max_retries:
                 continue
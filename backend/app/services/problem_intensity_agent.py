@@ -22,30 +22,37 @@ Rules
 from __future__ import annotations
 
 import asyncio
+import math
 import os
 import re
 import statistics
+from bisect import bisect_right
 from collections import Counter
 from datetime import datetime, timezone
+from itertools import chain, islice
 from typing import Any, Dict, List, Literal
 
 import httpx
+import orjson
 
 from ..models.idea import Idea
 from ..schemas.problem_intensity_schema import ProblemIntensitySignals
+from .http_client import get_http_client
+from .search_cache import get_cached_async, set_cached_async
+from .url_utils import url_key
 
 # ---------------------------------------------------------------------------
 # Tavily API configuration
 # ---------------------------------------------------------------------------
 _TAVILY_API_URL = "https://api.tavily.com/search"
-_TAVILY_TIMEOUT = 15.0
+_TAVILY_TIMEOUT = httpx.Timeout(15.0)
 _TAVILY_MAX_RESULTS = 5
 
 # ---------------------------------------------------------------------------
 # SerpAPI configuration
 # ---------------------------------------------------------------------------
 _SERPAPI_BASE_URL = "https://serpapi.com/search"
-_SERPAPI_TIMEOUT = 10.0
+_SERPAPI_TIMEOUT = httpx.Timeout(10.0)
 
 # ---------------------------------------------------------------------------
 # Pain / complaint keyword lexicons
@@ -64,12 +71,60 @@ _MANUAL_KEYWORDS: frozenset[str] = frozenset({
     "manual entry", "manual process", "data entry",
 })
 
-_COMPLAINT_PHRASES: list[str] = [
+_COMPLAINT_PHRASES: tuple[str, ...] = (
     "too slow", "too expensive", "takes too long", "waste of time",
     "hard to use", "not intuitive", "always breaks", "poor support",
     "no alternative", "stuck with", "forced to use", "hate using",
     "error prone", "constant errors", "unreliable",
-]
+)
+_COMPLAINT_PHRASE_SET: frozenset[str] = frozenset(_COMPLAINT_PHRASES)
+
+# Very common words never reported as top pain keywords
+_COMMON_WORDS: frozenset[str] = frozenset({
+    "the", "and", "for", "with", "that", "this", "from", "are", "was", "has",
+    "have", "not", "but", "can", "will", "been", "their", "about", "more",
+    "would", "which", "there", "what", "when", "your", "they", "each",
+    "how", "other", "into", "also", "its", "than", "most", "some", "our",
+})
+
+# ---------------------------------------------------------------------------
+# Confidence label indexed by the number of signal categories present (0–4)
+# ---------------------------------------------------------------------------
+_CONFIDENCE_BY_CATEGORY_COUNT: tuple[Literal["low", "medium", "high"], ...] = (
+    "low", "low", "medium", "high", "high",
+)
+
+# ---------------------------------------------------------------------------
+# Score bands — ascending thresholds, ``bisect_right`` returns the score index
+# ---------------------------------------------------------------------------
+# Strict ">" bounds are nudged to the next float up so bisect_right keeps
+# the boundary value in the lower band.
+_SEARCH_INTENT_THRESHOLDS: tuple[float, ...] = (0.2, 0.4, math.nextafter(0.6, math.inf))
+_SEARCH_INTENT_SCORES: tuple[float, ...] = (30.0, 45.0, 60.0, 75.0)
+_MANUAL_COST_THRESHOLDS: tuple[float, ...] = (5.0, math.nextafter(10.0, math.inf))
+_MANUAL_COST_SCORES: tuple[float, ...] = (50.0, 65.0, 80.0)
+
+# ---------------------------------------------------------------------------
+# Single-pass lexicon scanner
+# ---------------------------------------------------------------------------
+# All three lexicons are folded into one alternation so each passage is
+# scanned once instead of once per keyword.  The lookahead lets matches
+# overlap; with longest-first ordering every position reports the longest
+# term starting there, and ``_LEXICON_CLOSURE`` expands it to every term it
+# contains — reproducing plain ``kw in text`` semantics exactly.
+_LEXICON_TERMS: tuple[str, ...] = tuple(sorted(
+    _PAIN_KEYWORDS | _MANUAL_KEYWORDS | _COMPLAINT_PHRASE_SET,
+    key=len,
+    reverse=True,
+))
+_LEXICON_RE = re.compile("(?=(" + "|".join(map(re.escape, _LEXICON_TERMS)) + "))")
+_LEXICON_CLOSURE: dict[str, frozenset[str]] = {
+    term: frozenset(t for t in _LEXICON_TERMS if t in term)
+    for term in _LEXICON_TERMS
+}
+
+# Alphabetic tokens counted for keyword frequency (text is pre-lowercased)
+_TOKEN_RE = re.compile(r"[a-z]{3,}")
 
 
 # ===================================================================== #
@@ -185,13 +240,19 @@ async def _search_tavily(api_key: str, query: str) -> List[Dict[str, Any]]:
         "max_results": _TAVILY_MAX_RESULTS,
         "include_answer": False,
     }
+    cached = await get_cached_async("tavily", payload)
+    if cached is not None:
+        print(f"💾 [PROBLEM] Tavily cache hit: {len(cached)} results for {query!r}")
+        return cached
     try:
-        async with httpx.AsyncClient(timeout=_TAVILY_TIMEOUT) as client:
-            response = await client.post(_TAVILY_API_URL, json=payload)
+        response = await get_http_client().post(
+            _TAVILY_API_URL, json=payload, timeout=_TAVILY_TIMEOUT,
+        )
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             results = data.get("results", [])
             print(f"🔍 [PROBLEM] Tavily: {len(results)} results for {query!r}")
+            await set_cached_async("tavily", payload, results)
             return results
         else:
             print(f"⚠️  [PROBLEM] Tavily HTTP {response.status_code} for {query!r}")
@@ -202,21 +263,19 @@ async def _search_tavily(api_key: str, query: str) -> List[Dict[str, Any]]:
 
 
 async def _fetch_tavily_evidence(api_key: str, queries: List[str]) -> List[Dict[str, Any]]:
-    """Fetch all Tavily results across queries in parallel, deduplicated by URL."""
+    """Fetch all Tavily results across queries in parallel, deduplicated by canonical URL."""
     tasks = [_search_tavily(api_key, q) for q in queries]
     query_results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    all_results: list[dict] = []
-    seen_urls: set[str] = set()
-
-    for result in query_results:
-        if isinstance(result, Exception):
-            continue
-        for r in result:
-            url = r.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                all_results.append(r)
+    # First occurrence of each canonical URL wins
+    unique: dict[bytes, dict] = {}
+    for r in chain.from_iterable(
+        result for result in query_results if not isinstance(result, Exception)
+    ):
+        url = r.get("url", "")
+        if url:
+            unique.setdefault(url_key(url), r)
+    all_results = list(unique.values())
 
     print(f"📄 [PROBLEM] Total unique Tavily results: {len(all_results)}")
     return all_results
@@ -237,15 +296,21 @@ async def _serpapi_result_count(api_key: str, query: str) -> int:
         "api_key": api_key,
         "num": 1,  # We only need the result count, not actual results
     }
+    cached = await get_cached_async("serpapi_count", params)
+    if cached is not None:
+        print(f"💾 [PROBLEM] SerpAPI cache hit: {cached:,} results for {query!r}")
+        return cached
     try:
-        async with httpx.AsyncClient(timeout=_SERPAPI_TIMEOUT) as client:
-            response = await client.get(_SERPAPI_BASE_URL, params=params)
+        response = await get_http_client().get(
+            _SERPAPI_BASE_URL, params=params, timeout=_SERPAPI_TIMEOUT,
+        )
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             info = data.get("search_information", {})
-            count = info.get("total_results", 0)
+            count = int(info.get("total_results", 0))
             print(f"🔎 [PROBLEM] SerpAPI: {count:,} results for {query!r}")
-            return int(count)
+            await set_cached_async("serpapi_count", params, count)
+            return count
         else:
             print(f"⚠️  [PROBLEM] SerpAPI HTTP {response.status_code} for {query!r}")
             return 0
@@ -290,8 +355,8 @@ async def _compute_query_ratios(
         count = result if isinstance(result, int) else 0
         general_counts.append(count)
 
-    avg_problem = statistics.mean(problem_counts) if problem_counts else 0
-    avg_general = statistics.mean(general_counts) if general_counts else 0
+    avg_problem = statistics.fmean(problem_counts) if problem_counts else 0
+    avg_general = statistics.fmean(general_counts) if general_counts else 0
 
     total = avg_problem + avg_general
     problem_ratio = avg_problem / total if total > 0 else 0.0
@@ -313,6 +378,15 @@ async def _compute_query_ratios(
 #  Signal extraction from Tavily content                                  #
 # ===================================================================== #
 
+def _scan_lexicons(*texts: str) -> set[str]:
+    """Return every pain / complaint / manual term occurring in any of *texts*."""
+    found: set[str] = set()
+    for text in texts:
+        for term in _LEXICON_RE.findall(text):
+            found |= _LEXICON_CLOSURE[term]
+    return found
+
+
 def _extract_pain_signals(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Extract structured pain signals from Tavily search results.
 
@@ -334,37 +408,34 @@ def _extract_pain_signals(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     for result in results:
         content = (result.get("content") or "").lower()
         title = (result.get("title") or "").lower()
-        combined = f"{title} {content}"
 
-        if not combined.strip():
+        if not (title.strip() or content.strip()):
             continue
 
         total_passages += 1
 
+        # One scan per field for all three lexicons — title and content are
+        # searched in place rather than concatenated into a new string
+        hits = _scan_lexicons(title, content)
+
         # Check for pain keywords
-        has_pain = any(kw in combined for kw in _PAIN_KEYWORDS)
-        if has_pain:
+        if not hits.isdisjoint(_PAIN_KEYWORDS):
             pain_article_count += 1
 
-        # Check for complaint phrases
-        has_complaint = False
-        for phrase in _COMPLAINT_PHRASES:
-            if phrase in combined:
-                has_complaint = True
-                complaint_phrase_counter[phrase] += 1
-
-        if has_complaint:
+        # Check for complaint phrases (tuple order kept for tie-breaking)
+        if not hits.isdisjoint(_COMPLAINT_PHRASE_SET):
             complaint_passages += 1
+            complaint_phrase_counter.update(p for p in _COMPLAINT_PHRASES if p in hits)
 
         # Check for manual process signals
-        for mkw in _MANUAL_KEYWORDS:
-            if mkw in combined:
-                manual_detected = True
-                manual_keyword_hits += 1
+        manual_hits = len(hits & _MANUAL_KEYWORDS)
+        if manual_hits:
+            manual_detected = True
+            manual_keyword_hits += manual_hits
 
         # Extract tokens for keyword analysis
-        tokens = re.findall(r"[a-z]{3,}", combined)
-        all_text_tokens.update(tokens)
+        all_text_tokens.update(_TOKEN_RE.findall(title))
+        all_text_tokens.update(_TOKEN_RE.findall(content))
 
         # Try to extract publication date for recency
         pub_date = result.get("published_date") or result.get("publishedDate") or ""
@@ -378,18 +449,15 @@ def _extract_pain_signals(results: List[Dict[str, Any]]) -> Dict[str, Any]:
                 pass
 
     # Compute averages
-    avg_recency = statistics.mean(publication_months) if publication_months else 24.0  # default: 2 years old
+    avg_recency = statistics.fmean(publication_months) if publication_months else 24.0  # default: 2 years old
     complaint_density = complaint_passages / total_passages if total_passages > 0 else 0.0
 
     # Top pain keywords (exclude very common words)
-    common_exclude = {"the", "and", "for", "with", "that", "this", "from", "are", "was", "has",
-                      "have", "not", "but", "can", "will", "been", "their", "about", "more",
-                      "would", "which", "there", "what", "when", "your", "they", "each",
-                      "how", "other", "into", "also", "its", "than", "most", "some", "our"}
-    pain_kws = [
-        word for word, count in all_text_tokens.most_common(50)
-        if word in _PAIN_KEYWORDS and word not in common_exclude
-    ][:10]
+    pain_kws = list(islice(
+        (word for word, _ in all_text_tokens.most_common(50)
+         if word in _PAIN_KEYWORDS and word not in _COMMON_WORDS),
+        10,
+    ))
 
     # Top complaints
     top_complaints = [phrase for phrase, _ in complaint_phrase_counter.most_common(5)]
@@ -426,14 +494,7 @@ def _compute_search_intent_score(problem_query_ratio: float) -> float:
     0.2–0.4 → 45
     < 0.2 → 30
     """
-    if problem_query_ratio > 0.6:
-        return 75.0
-    elif problem_query_ratio >= 0.4:
-        return 60.0
-    elif problem_query_ratio >= 0.2:
-        return 45.0
-    else:
-        return 30.0
+    return _SEARCH_INTENT_SCORES[bisect_right(_SEARCH_INTENT_THRESHOLDS, problem_query_ratio)]
 
 
 def _compute_evidence_strength_score(
@@ -491,21 +552,13 @@ def _compute_manual_cost_score(
     """
     if not manual_detected:
         return 30.0
-    if time_waste_hours > 10:
-        return 80.0
-    elif time_waste_hours >= 5:
-        return 65.0
-    else:
-        return 50.0
+    return _MANUAL_COST_SCORES[bisect_right(_MANUAL_COST_THRESHOLDS, time_waste_hours)]
 
 
 def _apply_guardrails(
     raw_score: float,
     *,
-    search_intent_present: bool,
-    evidence_present: bool,
-    complaint_present: bool,
-    manual_present: bool,
+    categories_present: int,
     manual_detected: bool,
     complaint_score: float,
 ) -> float:
@@ -516,13 +569,6 @@ def _apply_guardrails(
     - If all signals missing → score = 35
     - Score NEVER 0, NEVER 100
     """
-    categories_present = sum([
-        search_intent_present,
-        evidence_present,
-        complaint_present,
-        manual_present,
-    ])
-
     # All missing → 35
     if categories_present == 0:
         print("📊 [PROBLEM] All signal categories missing → score = 35")
@@ -546,25 +592,14 @@ def _apply_guardrails(
     return round(score, 2)
 
 
-def _determine_confidence(
-    search_intent_present: bool,
-    evidence_present: bool,
-    complaint_present: bool,
-    manual_present: bool,
-) -> Literal["low", "medium", "high"]:
+def _determine_confidence(categories_present: int) -> Literal["low", "medium", "high"]:
     """Confidence assignment per spec.
 
     HIGH: ≥ 3 signal categories present
     MEDIUM: 2 categories present
     LOW: 0–1 category present
     """
-    count = sum([search_intent_present, evidence_present, complaint_present, manual_present])
-    if count >= 3:
-        return "high"
-    elif count == 2:
-        return "medium"
-    else:
-        return "low"
+    return _CONFIDENCE_BY_CATEGORY_COUNT[categories_present]
 
 
 # ===================================================================== #
@@ -660,27 +695,24 @@ async def fetch_problem_intensity_signals(idea: Idea) -> ProblemIntensitySignals
         + 0.20 * evidence_strength_score
     )
 
-    # ── 6. Determine which signal categories are present ──────────────
-    search_intent_present = total_problem_queries > 0 and problem_ratio > 0
-    evidence_present = pain_signals["pain_articles_count"] > 0
-    complaint_present = pain_signals["complaint_density"] > 0
-    manual_present = pain_signals["manual_process_detected"]
+    # ── 6. Count signal categories present (shared by steps 7 and 8) ──
+    categories_present = (
+        (total_problem_queries > 0 and problem_ratio > 0)
+        + (pain_signals["pain_articles_count"] > 0)
+        + (pain_signals["complaint_density"] > 0)
+        + bool(pain_signals["manual_process_detected"])
+    )
 
     # ── 7. Apply guardrails ───────────────────────────────────────────
     final_score = _apply_guardrails(
         raw_score,
-        search_intent_present=search_intent_present,
-        evidence_present=evidence_present,
-        complaint_present=complaint_present,
-        manual_present=manual_present,
+        categories_present=categories_present,
         manual_detected=pain_signals["manual_process_detected"],
         complaint_score=complaint_score,
     )
 
     # ── 8. Confidence ─────────────────────────────────────────────────
-    confidence = _determine_confidence(
-        search_intent_present, evidence_present, complaint_present, manual_present,
-    )
+    confidence = _determine_confidence(categories_present)
 
     # ── 9. Build explanation ──────────────────────────────────────────
     parts = [
@@ -13,7 +13,6 @@ Rules
 
 from __future__ import annotations
 
-import re
 from typing import List
 
 from ..models.idea import Idea
@@ -37,14 +36,18 @@ _STOP_WORDS: frozenset[str] = frozenset(
     }
 )
 
+# Punctuation treated as a token boundary by _tokenise (whitespace is
+# handled by str.split()).
+_DELIMITER_TABLE = str.maketrans(dict.fromkeys("-_,;:.!?'\"()[]{}", " "))
+
 # ---------------------------------------------------------------------------
 # Revenue-model → market-level descriptors used in core & trend keywords.
 # ---------------------------------------------------------------------------
-_REVENUE_DESCRIPTORS: dict[str, list[str]] = {
-    "Subscription": ["subscription", "saas"],
-    "One-time": ["purchase", "one-time"],
-    "Marketplace Fee": ["marketplace", "platform"],
-    "Ads": ["ad-supported", "free platform"],
+_REVENUE_DESCRIPTORS: dict[str, tuple[str, ...]] = {
+    "Subscription": ("subscription", "saas"),
+    "One-time": ("purchase", "one-time"),
+    "Marketplace Fee": ("marketplace", "platform"),
+    "Ads": ("ad-supported", "free platform"),
 }
 
 # ---------------------------------------------------------------------------
@@ -60,14 +63,14 @@ _CUSTOMER_LABELS: dict[str, str] = {
 # ---------------------------------------------------------------------------
 # Pain-signal phrases appended to reddit queries.
 # ---------------------------------------------------------------------------
-_PAIN_PHRASES: list[str] = [
+_PAIN_PHRASES: tuple[str, ...] = (
     "problem",
     "pain",
     "issue",
     "frustration",
     "struggling with",
     "hate",
-]
+)
 
 
 
@@ -81,7 +84,7 @@ def _tokenise(text: str) -> List[str]:
     Returns only tokens with length > 2 so single-letter and very short
     fragments are discarded.
     """
-    tokens = re.split(r"[\s\-_,;:\.!?'\"()\[\]{}]+", text.lower())
+    tokens = text.lower().translate(_DELIMITER_TABLE).split()
     return [
         t for t in tokens
         if t.isalpha() and len(t) > 2 and t not in _STOP_WORDS
@@ -90,14 +93,13 @@ def _tokenise(text: str) -> List[str]:
 
 def _dedupe(items: List[str]) -> List[str]:
     """Return *items* with duplicates removed, preserving first-seen order."""
-    seen: set[str] = set()
-    out: list[str] = []
+    # Insertion-ordered dict: first spelling of each normalised key wins
+    first_seen: dict[str, str] = {}
     for item in items:
         key = item.lower().strip()
-        if key and key not in seen:
-            seen.add(key)
-            out.append(item)
-    return out
+        if key:
+            first_seen.setdefault(key, item)
+    return list(first_seen.values())
 
 
 def _safe(value: str) -> str:
@@ -139,7 +141,7 @@ def build_query_bundle(idea: Idea) -> QueryBundle:
     audience = _CUSTOMER_LABELS.get(customer_size, customer_size.lower())
 
     # Revenue descriptors (e.g. ["subscription", "saas"])
-    rev_tags = _REVENUE_DESCRIPTORS.get(revenue_model, [revenue_model.lower()])
+    rev_tags = _REVENUE_DESCRIPTORS.get(revenue_model, (revenue_model.lower(),))
 
     # ------------------------------------------------------------------ #
     #  1. Core keywords                                                    #
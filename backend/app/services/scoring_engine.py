@@ -21,7 +21,11 @@ from ..schemas.score_schema import ModuleScores
 
 def _clamp(value: float, lo: float = 0.0, hi: float = 100.0) -> float:
     """Clamp *value* to [lo, hi]."""
-    return max(lo, min(hi, value))
+    # Plain comparisons instead of max(min()) — called for every signal.
+    # NaN still maps to *hi*, as it did with max(lo, min(hi, value)).
+    if value < lo:
+        return lo
+    return value if value <= hi else hi
 
 
 def compute_scores(normalized: NormalizedSignals) -> ModuleScores:
@@ -0,0 +1,147 @@
+"""On-disk response cache for the paid search APIs (Exa / Tavily / SerpAPI).
+
+Validated OpenAI idea-attribute inferences (service "inference") and
+market-research reasoning (service "reasoning") can be stored here too.
+LLM output is not deterministic — it is sampled at the configured
+temperature — so those services are opt-in with their own TTL: a hit
+replays an earlier answer instead of drawing a fresh one.
+
+Successful responses are stored in a small SQLite file, keyed by a SHA-256
+of the service name and the canonical request (API keys stripped), so
+re-evaluating the same idea — or retrying after a partial failure — does
+not spend search quota again.
+
+Configuration (read on first use, after ``.env`` is loaded):
+  SEARCH_CACHE_PATH       — SQLite file (default ./search_cache.sqlite3)
+  SEARCH_CACHE_TTL_HOURS  — entry lifetime in hours (default 24, 0 disables)
+  INFERENCE_CACHE_TTL_HOURS,
+  REASONING_CACHE_TTL_HOURS — per-service LLM lifetimes (default 0 = off)
+
+Cache failures are logged and treated as misses; they never break an agent.
+
+The agents call the ``*_async`` wrappers, which run the SQLite I/O in a
+worker thread so a slow disk or lock contention never stalls the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+_DEFAULT_PATH = "./search_cache.sqlite3"
+_DEFAULT_TTL_HOURS = 24.0
+
+# Services whose values are LLM output: each reads its own TTL variable and
+# defaults to 0 (disabled) instead of sharing the search-response TTL.
+_LLM_TTL_ENV: Mapping[str, str] = MappingProxyType({
+    "inference": "INFERENCE_CACHE_TTL_HOURS",
+    "reasoning": "REASONING_CACHE_TTL_HOURS",
+})
+
+# Request fields that must never become part of a cache key.
+_SECRET_FIELDS: frozenset[str] = frozenset({"api_key"})
+
+# ---------------------------------------------------------------------------
+# Singleton SQLite connection
+# ---------------------------------------------------------------------------
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+
+def _ttl_seconds(service: str) -> float:
+    env_name = _LLM_TTL_ENV.get(service)
+    if env_name is None:
+        env_name, default = "SEARCH_CACHE_TTL_HOURS", _DEFAULT_TTL_HOURS
+    else:
+        default = 0.0
+    try:
+        hours = float(os.getenv(env_name, str(default)))
+    except ValueError:
+        hours = default
+    return hours * 3600.0
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Return the singleton SQLite connection (creates the table if missing)."""
+    global _conn
+    if _conn is None:
+        path = os.getenv("SEARCH_CACHE_PATH", _DEFAULT_PATH)
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+        _conn = conn
+        print(f"💾 [CACHE] Search cache initialized at {path}")
+    return _conn
+
+
+def _cache_key(service: str, request: Mapping[str, Any]) -> str:
+    canonical = {k: v for k, v in request.items() if k not in _SECRET_FIELDS}
+    raw = orjson.dumps([service, canonical], option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(raw).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def get_cached(service: str, request: Mapping[str, Any]) -> Optional[Any]:
+    """Return the cached value for *request*, or None on miss / expiry."""
+    if _ttl_seconds(service) <= 0:
+        return None
+    key = _cache_key(service, request)
+    try:
+        with _lock:
+            row = _get_connection().execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,),
+            ).fetchone()
+    except sqlite3.Error as exc:
+        logger.warning("[CACHE] Read failed for %s: %s", service, exc)
+        return None
+    if row is None or row[1] < time.time():
+        return None
+    return orjson.loads(row[0])
+
+
+def set_cached(service: str, request: Mapping[str, Any], value: Any) -> None:
+    """Store a JSON-serialisable *value* for *request*."""
+    ttl = _ttl_seconds(service)
+    if ttl <= 0:
+        return
+    key = _cache_key(service, request)
+    try:
+        with _lock:
+            _get_connection().execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, orjson.dumps(value), time.time() + ttl),
+            )
+    except (sqlite3.Error, orjson.JSONEncodeError) as exc:
+        logger.warning("[CACHE] Write failed for %s: %s", service, exc)
+
+
+async def get_cached_async(service: str, request: Mapping[str, Any]) -> Optional[Any]:
+    """Async version of get_cached — runs the SQLite read off the event loop."""
+    return await asyncio.to_thread(get_cached, service, request)
+
+
+async def set_cached_async(service: str, request: Mapping[str, Any], value: Any) -> None:
+    """Async version of set_cached — runs the SQLite write off the event loop."""
+    await asyncio.to_thread(set_cached, service, request, value)
@@ -0,0 +1,64 @@
+"""Rule-based evaluation summary.
+
+Turns module scores into the short verdict / risk / strength summary shown
+with every evaluation report and reused by the pitch-deck pipeline.
+
+Rules
+-----
+- NO API calls
+- NO DB writes
+- NO LLMs
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+
+from ..schemas.score_schema import ModuleScores
+
+# Verdict bands: < 55 → Weak, 55–75 → Moderate, ≥ 75 → Strong.
+# Thresholds are sorted ascending; ``bisect_right`` returns the label index.
+_VERDICT_THRESHOLDS: tuple[float, ...] = (55.0, 75.0)
+_VERDICT_LABELS: tuple[str, ...] = ("Weak", "Moderate", "Strong")
+
+
+def _verdict_label(final_score: float) -> str:
+    return _VERDICT_LABELS[bisect_right(_VERDICT_THRESHOLDS, final_score)]
+
+
+def _risk_label(competition_pressure: float, execution_feasibility: float) -> str:
+    if competition_pressure < 40 or execution_feasibility < 30:
+        return "High"
+    if competition_pressure < 60 or execution_feasibility < 50:
+        return "Medium"
+    return "Low"
+
+
+def generate_summary(scores: ModuleScores) -> dict[str, str]:
+    """Produce a rule-based summary dict from module scores.  No LLM."""
+
+    # --- verdict ---
+    verdict = _verdict_label(scores.final_viability_score)
+
+    # --- risk_level ---
+    risk_level = _risk_label(scores.competition_pressure, scores.execution_feasibility)
+
+    # --- key_strength (highest scoring module) ---
+    module_map: dict[str, float] = {
+        "Problem Intensity": scores.problem_intensity,
+        "Market Timing": scores.market_timing,
+        "Competition Pressure": scores.competition_pressure,
+        "Market Potential": scores.market_potential,
+        "Execution Feasibility": scores.execution_feasibility,
+    }
+    key_strength = max(module_map, key=module_map.get)  # type: ignore[arg-type]
+
+    # --- key_risk (lowest scoring module) ---
+    key_risk = min(module_map, key=module_map.get)  # type: ignore[arg-type]
+
+    return {
+        "verdict": verdict,
+        "risk_level": risk_level,
+        "key_strength": key_strength,
+        "key_risk": key_risk,
+    }
@@ -17,12 +17,16 @@ import asyncio
 import logging
 import os
 import statistics
+from itertools import zip_longest
 from typing import Dict, List, Any
 
 import httpx
+import orjson
 
 from ..schemas.query_schema import QueryBundle
 from ..schemas.trend_schema import TrendDemandSignals
+from .http_client import get_http_client
+from .search_cache import get_cached_async, set_cached_async
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +34,7 @@ logger = logging.getLogger(__name__)
 # SerpAPI configuration
 # ---------------------------------------------------------------------------
 _SERPAPI_BASE_URL = "https://serpapi.com/search"
-_REQUEST_TIMEOUT = 10.0  # seconds per request
+_REQUEST_TIMEOUT = httpx.Timeout(10.0)  # seconds per request
 _MAX_RETRIES = 2
 _INITIAL_BACKOFF = 1.5  # seconds
 
@@ -71,16 +75,21 @@ async def _fetch_timeseries(api_key: str, keyword: str, geo: str = "") -> List[i
 
     print(f"🔍 [SerpAPI] Fetching timeseries for keyword={keyword!r}, geo={geo!r}")
 
+    cached = await get_cached_async("serpapi_trends", params)
+    if cached is not None:
+        print(f"💾 [SerpAPI] Cache hit: keyword={keyword!r} → {len(cached)} data points")
+        return cached
+
     for attempt in range(_MAX_RETRIES + 1):
         try:
-            async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT) as client:
-                response = await client.get(
-                    _SERPAPI_BASE_URL,
-                    params=params,
-                )
+            response = await get_http_client().get(
+                _SERPAPI_BASE_URL,
+                params=params,
+                timeout=_REQUEST_TIMEOUT,
+            )
             print(f"📦 [SerpAPI] HTTP {response.status_code} for keyword={keyword!r}")
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 timeline = (
                     data
                     .get("interest_over_time", {})
@@ -92,6 +101,7 @@ async def _fetch_timeseries(api_key: str, keyword: str, geo: str = "") -> List[i
                     if entries:
                         values.append(entries[0].get("extracted_value", 0))
                 print(f"📦 [SerpAPI] keyword={keyword!r} → {len(values)} data points")
+                await set_cached_async("serpapi_trends", params, values)
                 return values
 
             # Non-retryable HTTP errors
@@ -182,11 +192,11 @@ def _volatility_index(values: List[int]) -> float:
     if len(values) < 2:
         return 0.0
 
-    mean_val = sum(values) / len(values)
+    mean_val = statistics.fmean(values)
     if mean_val == 0:
         return 0.0
 
-    std_dev = statistics.stdev(values)
+    std_dev = statistics.stdev(values, mean_val)
     vol = std_dev / mean_val
     return max(0.0, min(1.0, vol))
 
@@ -225,16 +235,25 @@ async def _fetch_search_demand_proxy(
     print(f"\U0001f50d [SerpAPI] Fetching search demand proxy for keyword={keyword!r}")
 
     try:
-        async with httpx.AsyncClient(timeout=_REQUEST_TIMEOUT) as client:
-            response = await client.get(
+        data = await get_cached_async("serpapi_demand", params)
+        if data is not None:
+            print(f"\U0001f4be [SerpAPI] Demand proxy cache hit for keyword={keyword!r}")
+        else:
+            response = await get_http_client().get(
                 _SERPAPI_BASE_URL,
                 params=params,
+                timeout=_REQUEST_TIMEOUT,
             )
-        if response.status_code != 200:
-            print(f"\u26a0\ufe0f [SerpAPI] Demand proxy HTTP {response.status_code} for keyword={keyword!r}")
-            return 0.0
+            if response.status_code != 200:
+                print(f"\u26a0\ufe0f [SerpAPI] Demand proxy HTTP {response.status_code} for keyword={keyword!r}")
+                return 0.0
 
-        data = response.json()
+            data = orjson.loads(response.content)
+            # Only the two fields read below are worth keeping on disk
+            await set_cached_async("serpapi_demand", params, {
+                "search_information": data.get("search_information", {}),
+                "related_searches": data.get("related_searches", []),
+            })
 
         search_info = data.get("search_information", {})
         print(f"\U0001f4e6 [SerpAPI] search_information: {search_info}")
@@ -288,22 +307,28 @@ async def _try_keywords(api_key: str, keywords: List[str]) -> List[List[int]]:
 
 
 def _aggregate_series(per_keyword_values: List[List[int]]) -> List[int]:
-    """Average multiple keyword series into a single time-series."""
-    max_len = max(len(v) for v in per_keyword_values)
-    averaged: List[float] = []
-    for i in range(max_len):
-        bucket: List[int] = []
-        for kw_vals in per_keyword_values:
-            if i < len(kw_vals):
-                bucket.append(kw_vals[i])
-        averaged.append(sum(bucket) / len(bucket))
-    return [int(round(v)) for v in averaged]
+    """Average multiple keyword series into a single time-series.
+
+    The series are transposed with ``zip_longest`` so every time bucket is
+    averaged in one pass; shorter series drop out of the trailing buckets.
+    """
+    if len(per_keyword_values) == 1:
+        return [int(round(v)) for v in per_keyword_values[0]]
+
+    averaged: List[int] = []
+    for column in zip_longest(*per_keyword_values):
+        bucket = [v for v in column if v is not None]
+        averaged.append(int(round(sum(bucket) / len(bucket))))
+    return averaged
 
 
-def _is_usable(avg_vol: float, growth: float, momentum: float) -> bool:
-    """Trend data is usable if any core metric is non-zero."""
-    demand = _demand_strength(avg_vol, growth)
-    return demand > 0 or growth != 0.0 or momentum != 0.5
+def _is_usable(demand: float, growth: float, momentum: float) -> bool:
+    """Trend data is usable if any core metric is non-zero.
+
+    *demand* is the ``_demand_strength`` the caller already derived for the
+    same series, so the selected tier never computes it twice.
+    """
+    return growth != 0.0 or momentum != 0.5 or demand > 0
 
 
 async def fetch_trend_demand_signals(query_bundle: QueryBundle) -> TrendDemandSignals:
@@ -367,8 +392,9 @@ async def fetch_trend_demand_signals(query_bundle: QueryBundle) -> TrendDemandSi
         avg_vol = _avg_search_volume(candidate_series)
         growth = _growth_rate_5y(candidate_series)
         momentum = _momentum_score(candidate_series)
+        demand = _demand_strength(avg_vol, growth)
 
-        if _is_usable(avg_vol, growth, momentum):
+        if _is_usable(demand, growth, momentum):
             int_series = candidate_series
             selected_tier = tier_name
             print(f"✅ [SerpAPI] Using Tier: {tier_name}")
@@ -383,12 +409,10 @@ async def fetch_trend_demand_signals(query_bundle: QueryBundle) -> TrendDemandSi
 
     # ------------------------------------------------------------------ #
     #  Compute metrics                                                    #
+    #  avg_vol / growth / momentum / demand were already computed for the #
+    #  selected series by the tier loop — only volatility is new.         #
     # ------------------------------------------------------------------ #
-    avg_vol = _avg_search_volume(int_series)
-    growth = _growth_rate_5y(int_series)
-    momentum = _momentum_score(int_series)
     volatility = _volatility_index(int_series)
-    demand = _demand_strength(avg_vol, growth)
 
     print(f"📊 [SerpAPI] Avg search volume (0-100 scale): {round(avg_vol, 2)}")
     print(f"📈 [SerpAPI] Growth rate (5y): {round(growth, 4)}")
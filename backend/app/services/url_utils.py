@@ -0,0 +1,59 @@
+"""URL canonicalisation for de-duplicating search results.
+
+Tavily and Exa frequently return the same page under cosmetically
+different URLs (``http://`` vs ``https://``, ``www.``, trailing slash,
+``?utm_source=…``).  ``url_key`` maps all of those to one compact 8-byte
+digest so evidence is counted — and later embedded — only once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Query parameters that only track the click, never change the page.
+_TRACKING_PARAMS: frozenset[str] = frozenset({
+    "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "ref", "ref_src",
+})
+_TRACKING_PREFIXES: tuple[str, ...] = ("utm_",)
+
+# Ports that are implied by the scheme and therefore dropped.
+_DEFAULT_PORTS: frozenset[tuple[str, int]] = frozenset({("http", 80), ("https", 443)})
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES)
+
+
+def canonical_url(url: str) -> str:
+    """Return *url* without scheme, ``www.``, fragment, tracking params or trailing slash.
+
+    Host casing is normalised and the scheme's default port is dropped;
+    path and remaining query casing are kept.
+    Unparseable input is returned stripped and otherwise unchanged.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        host = parts.hostname or ""
+        port = parts.port
+    except ValueError:
+        return url
+    if not host:
+        return url
+
+    host = host.removeprefix("www.")
+    if port is not None and (parts.scheme.lower(), port) not in _DEFAULT_PORTS:
+        host = f"{host}:{port}"
+    path = parts.path.rstrip("/")
+    query = urlencode(
+        [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+         if not _is_tracking_param(k)]
+    )
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def url_key(url: str) -> bytes:
+    """8-byte BLAKE2b digest of ``canonical_url(url)`` — a compact dedup key."""
+    return hashlib.blake2b(canonical_url(url).encode(), digest_size=8).digest()
@@ -7,18 +7,27 @@ Handles:
   - Querying by idea_id with top-k retrieval
 
 Storage: /app/vector_store (configurable via CHROMADB_PERSIST_DIR)
-Embeddings: OpenAI text-embedding-3-large
+Embeddings: OpenAI text-embedding-3-large (vectors cached on disk by embedding_cache),
+            optionally shortened via EMBEDDING_DIMENSIONS
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
 import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 import chromadb
 import httpx
+import orjson
+
+from .embedding_cache import get_cached_embeddings, set_cached_embeddings
+from .http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +38,44 @@ _PERSIST_DIR = os.getenv("CHROMADB_PERSIST_DIR", "./vector_store")
 _COLLECTION_NAME = "startbot_agent_outputs"
 _EMBEDDING_MODEL = "text-embedding-3-large"
 _OPENAI_EMBEDDINGS_URL = "https://api.openai.com/v1/embeddings"
-_EMBEDDING_TIMEOUT = 15.0
+_EMBEDDING_TIMEOUT = httpx.Timeout(15.0)
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_dimensions() -> Optional[int]:
+    """Requested vector size, or None for the model's native size.
+
+    text-embedding-3 models accept a ``dimensions`` parameter that returns
+    shortened, re-normalised vectors — e.g. 512 instead of 3072 cuts cache,
+    Chroma storage and cosine cost ~6x with little retrieval loss.
+    """
+    raw = os.getenv("EMBEDDING_DIMENSIONS", "").strip()
+    try:
+        dims = int(raw) if raw else 0
+    except ValueError:
+        logger.warning("[VECTOR] Ignoring invalid EMBEDDING_DIMENSIONS=%r", raw)
+        dims = 0
+    return dims if dims > 0 else None
+
+
+def _embedding_variant() -> str:
+    """Model name plus shortened size — vectors of different variants never mix."""
+    dims = _get_embedding_dimensions()
+    return f"{_EMBEDDING_MODEL}@{dims}" if dims else _EMBEDDING_MODEL
+
+
+def _collection_name() -> str:
+    dims = _get_embedding_dimensions()
+    return f"{_COLLECTION_NAME}_{dims}d" if dims else _COLLECTION_NAME
+
+
+def _embedding_payload(texts: List[str]) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"model": _EMBEDDING_MODEL, "input": texts}
+    dims = _get_embedding_dimensions()
+    if dims:
+        payload["dimensions"] = dims
+    return payload
+
 
 # ---------------------------------------------------------------------------
 # Singleton ChromaDB client
@@ -60,11 +106,12 @@ def get_collection() -> chromadb.Collection:
     global _collection
     if _collection is None:
         client = get_client()
+        name = _collection_name()
         _collection = client.get_or_create_collection(
-            name=_COLLECTION_NAME,
+            name=name,
             metadata={"hnsw:space": "cosine"},
         )
-        print(f"🗄️  [VECTOR] Collection '{_COLLECTION_NAME}' ready (count={_collection.count()})")
+        print(f"🗄️  [VECTOR] Collection '{name}' ready (count={_collection.count()})")
     return _collection
 
 
@@ -72,17 +119,51 @@ def get_collection() -> chromadb.Collection:
 # Embedding helper
 # ---------------------------------------------------------------------------
 
+def _merge_cached(
+    texts: List[str],
+) -> tuple[List[Optional[List[float]]], List[str]]:
+    """Look *texts* up in the embedding cache.
+
+    Returns the per-text vectors (None where missing) and the distinct
+    texts that still need an API call, in first-seen order — duplicate
+    texts within one batch are only sent (and billed) once.
+    """
+    vectors = get_cached_embeddings(_embedding_variant(), texts)
+    misses = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+    hits = sum(v is not None for v in vectors)
+    if hits:
+        print(f"💾 [VECTOR] Embedding cache: {hits}/{len(texts)} hits")
+    return vectors, misses
+
+
+def _fill_misses(
+    texts: List[str],
+    vectors: List[Optional[List[float]]],
+    misses: List[str],
+    fresh: List[List[float]],
+) -> List[List[float]]:
+    """Fan freshly fetched vectors out to every gap and write them to the cache."""
+    set_cached_embeddings(_embedding_variant(), misses, fresh)
+    by_text = dict(zip(misses, fresh))
+    return [v if v is not None else by_text[t] for t, v in zip(texts, vectors)]
+
+
 def _embed_texts(texts: List[str]) -> List[List[float]]:
+    """Return embeddings for *texts*, calling OpenAI only for cache misses."""
+    vectors, misses = _merge_cached(texts)
+    if not misses:
+        return vectors
+    return _fill_misses(texts, vectors, misses, _request_embeddings(misses))
+
+
+def _request_embeddings(texts: List[str]) -> List[List[float]]:
     """Call OpenAI embeddings API and return vectors."""
     api_key = _get_openai_key()
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
-    payload = {
-        "model": _EMBEDDING_MODEL,
-        "input": texts,
-    }
+    payload = _embedding_payload(texts)
     response = httpx.post(
         _OPENAI_EMBEDDINGS_URL,
         headers=headers,
@@ -93,7 +174,7 @@ def _embed_texts(texts: List[str]) -> List[List[float]]:
         logger.error("[VECTOR] Embedding API error: %s", response.text[:300])
         raise RuntimeError(f"Embedding API returned {response.status_code}")
 
-    data = response.json()
+    data = orjson.loads(response.content)
     embeddings = [item["embedding"] for item in data["data"]]
     return embeddings
 
@@ -134,13 +215,16 @@ def _make_chunk(
 # ---------------------------------------------------------------------------
 # Agent-specific chunkers
 # ---------------------------------------------------------------------------
+# Shared read-only stand-in for a missing report section — avoids allocating
+# a throwaway ``{}`` per lookup.
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
 
 def chunk_evaluation(idea_id: str, report: dict) -> List[Dict[str, Any]]:
     """Chunk an evaluation report into semantic sections."""
     chunks = []
-    scores = report.get("module_scores", {})
-    summary = report.get("summary", {})
-    normalized = report.get("normalized_signals", {})
+    scores = report.get("module_scores") or _EMPTY_SECTION
+    summary = report.get("summary") or _EMPTY_SECTION
 
     # Chunk 1: Overall verdict and scores
     verdict_text = (
@@ -168,7 +252,7 @@ def chunk_evaluation(idea_id: str, report: dict) -> List[Dict[str, Any]]:
     competitors = report.get("competitor_names", [])
     if competitors:
         comp_text = (
-            f"Competitors discovered during validation: {', '.join(competitors[:8])}. "
+            f"Competitors discovered during validation: {', '.join(islice(competitors, 8))}. "
             f"Total competitors found: {len(competitors)}."
         )
         chunks.append(_make_chunk(idea_id, "idea_validation", "competitors", comp_text))
@@ -208,7 +292,7 @@ def chunk_market_research(idea_id: str, record: dict) -> List[Dict[str, Any]]:
     competitors = record.get("competitors", [])
     if competitors:
         comp_text = (
-            f"Market Research Competitors: {', '.join(competitors[:8])}. "
+            f"Market Research Competitors: {', '.join(islice(competitors, 8))}. "
             f"Total competitor count: {record.get('competitor_count', len(competitors))}."
         )
         chunks.append(_make_chunk(idea_id, "market_research", "competition", comp_text))
@@ -222,7 +306,7 @@ def chunk_market_research(idea_id: str, record: dict) -> List[Dict[str, Any]]:
             if isinstance(assumptions, list):
                 meta_text += f"Assumptions: {'; '.join(str(a) for a in assumptions[:5])}. "
             elif isinstance(assumptions, dict):
-                meta_text += f"Assumptions: {'; '.join(f'{k}: {v}' for k, v in list(assumptions.items())[:5])}. "
+                meta_text += f"Assumptions: {'; '.join(f'{k}: {v}' for k, v in islice(assumptions.items(), 5))}. "
         if confidence:
             if isinstance(confidence, dict):
                 meta_text += f"Confidence: {'; '.join(f'{k}: {v}' for k, v in confidence.items())}."
@@ -387,27 +471,37 @@ def query_by_idea(
 
 
 async def _embed_texts_async(texts: List[str]) -> List[List[float]]:
-    """Async version of _embed_texts — non-blocking OpenAI embeddings call."""
+    """Async version of _embed_texts — non-blocking OpenAI embeddings call.
+
+    The embedding-cache SQLite reads and writes run in a worker thread so
+    they never stall the event loop.
+    """
+    vectors, misses = await asyncio.to_thread(_merge_cached, texts)
+    if not misses:
+        return vectors
+    fresh = await _request_embeddings_async(misses)
+    return await asyncio.to_thread(_fill_misses, texts, vectors, misses, fresh)
+
+
+async def _request_embeddings_async(texts: List[str]) -> List[List[float]]:
+    """Async version of _request_embeddings."""
     api_key = _get_openai_key()
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
-    payload = {
-        "model": _EMBEDDING_MODEL,
-        "input": texts,
-    }
-    async with httpx.AsyncClient(timeout=_EMBEDDING_TIMEOUT) as client:
-        response = await client.post(
-            _OPENAI_EMBEDDINGS_URL,
-            headers=headers,
-            json=payload,
-        )
+    payload = _embedding_payload(texts)
+    response = await get_http_client().post(
+        _OPENAI_EMBEDDINGS_URL,
+        headers=headers,
+        json=payload,
+        timeout=_EMBEDDING_TIMEOUT,
+    )
     if response.status_code != 200:
         logger.error("[VECTOR] Embedding API error: %s", response.text[:300])
         raise RuntimeError(f"Embedding API returned {response.status_code}")
 
-    data = response.json()
+    data = orjson.loads(response.content)
     embeddings = [item["embedding"] for item in data["data"]]
     return embeddings
 
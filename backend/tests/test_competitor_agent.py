@@ -0,0 +1,86 @@
+"""Competitor agent tests — founding-year extraction, retry backoff."""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+# Ensure the backend package is importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.competitor_agent import (
+    _INITIAL_BACKOFF,
+    _MAX_BACKOFF,
+    _extract_founding_year,
+    _retry_delay,
+)
+
+
+# ===================================================================== #
+#  Unit tests: _extract_founding_year                                     #
+# ===================================================================== #
+
+class TestExtractFoundingYear:
+    def test_founded_in(self):
+        assert _extract_founding_year("Acme was founded in 2018.") == 2018
+
+    def test_est_abbreviation(self):
+        assert _extract_founding_year("Est. 2015, serving SMBs") == 2015
+
+    def test_since(self):
+        assert _extract_founding_year("Trusted by teams since 2020") == 2020
+
+    def test_founded_wins_over_earlier_since(self):
+        assert _extract_founding_year("since 2015, founded 2019") == 2019
+
+    def test_skips_implausible_year(self):
+        assert _extract_founding_year("est. 1850 ... launched 2020") == 2020
+
+    def test_falls_back_to_since_when_founded_implausible(self):
+        assert _extract_founding_year("founded 1850, online since 2012") == 2012
+
+    def test_future_year_ignored(self):
+        assert _extract_founding_year("founded in 2999") is None
+
+    def test_no_match(self):
+        assert _extract_founding_year("A modern payments platform") is None
+
+
+# ===================================================================== #
+#  Unit tests: _retry_delay                                               #
+# ===================================================================== #
+
+class TestRetryDelay:
+    def test_retry_after_seconds(self):
+        assert _retry_delay(0, "3") == 3.0
+
+    def test_retry_after_capped(self):
+        assert _retry_delay(0, "120") == _MAX_BACKOFF
+
+    def test_retry_after_negative_clamped(self):
+        assert _retry_delay(0, "-5") == 0.0
+
+    def test_retry_after_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=5)
+        delay = _retry_delay(0, format_datetime(when, usegmt=True))
+        assert 3.0 <= delay <= 5.0
+
+    def test_retry_after_http_date_in_past(self):
+        assert _retry_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid_header_falls_back_to_backoff(self):
+        for header in ("garbage", "nan", ""):
+            delay = _retry_delay(1, header)
+            assert 0.5 * 2 * _INITIAL_BACKOFF <= delay <= 2 * _INITIAL_BACKOFF
+
+    def test_missing_header_jitter_bounds(self):
+        for attempt in range(6):
+            base = min(_INITIAL_BACKOFF * (2 ** attempt), _MAX_BACKOFF)
+            for _ in range(50):
+                assert 0.5 * base <= _retry_delay(attempt, None) <= base
+
+    def test_jitter_uses_equal_jitter_range(self):
+        with patch("app.services.competitor_agent.random.uniform", return_value=0.5) as uniform:
+            assert _retry_delay(2, None) == 0.5 * 4 * _INITIAL_BACKOFF
+        uniform.assert_called_once_with(0.5, 1.0)
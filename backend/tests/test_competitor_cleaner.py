@@ -0,0 +1,44 @@
+"""Competitor cleaner tests — excluded-domain matching."""
+
+import os
+import sys
+
+# Ensure the backend package is importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.competitor_cleaner import is_excluded_domain
+
+
+# ===================================================================== #
+#  Unit tests: is_excluded_domain                                         #
+# ===================================================================== #
+
+class TestIsExcludedDomain:
+    def test_exact_domain_excluded(self):
+        assert is_excluded_domain("g2.com") is True
+
+    def test_subdomain_excluded(self):
+        assert is_excluded_domain("sub.g2.com") is True
+        assert is_excluded_domain("blog.medium.com") is True
+
+    def test_label_prefix_not_excluded(self):
+        assert is_excluded_domain("notg2.com") is False
+        assert is_excluded_domain("dropbox.com") is False
+
+    def test_port_and_trailing_dot_ignored(self):
+        assert is_excluded_domain("g2.com:443") is True
+        assert is_excluded_domain("g2.com.") is True
+
+    def test_regional_country_code_excluded(self):
+        assert is_excluded_domain("forbes.com.au") is True
+        assert is_excluded_domain("uk.businessinsider.com.mx") is True
+
+    def test_regional_suffix_needs_excluded_base(self):
+        assert is_excluded_domain("stripe.com.au") is False
+        assert is_excluded_domain("goodfirms.co") is True
+
+    def test_company_domain_not_excluded(self):
+        assert is_excluded_domain("stripe.com") is False
+
+    def test_custom_excluded_set(self):
+        assert is_excluded_domain("app.acme.io", frozenset({"acme.io"})) is True
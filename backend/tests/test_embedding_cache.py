@@ -0,0 +1,73 @@
+"""Embedding cache tests — float32 packing, key separation, legacy table."""
+
+import os
+import sys
+
+# Ensure the backend package is importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import json
+import sqlite3
+
+import pytest
+
+from app.services import embedding_cache
+from app.services.embedding_cache import get_cached_embeddings, set_cached_embeddings
+
+MODEL = "text-embedding-3-large"
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(tmp_path, monkeypatch):
+    """Point the cache at a throwaway SQLite file."""
+    path = tmp_path / "embedding_cache.sqlite3"
+    monkeypatch.setenv("EMBEDDING_CACHE_PATH", str(path))
+    monkeypatch.setattr(embedding_cache, "_conn", None)
+    yield path
+    if embedding_cache._conn is not None:
+        embedding_cache._conn.close()
+
+
+# ===================================================================== #
+#  Unit tests: embedding_cache                                            #
+# ===================================================================== #
+
+class TestEmbeddingCache:
+    def test_float32_roundtrip_within_tolerance(self):
+        vector = [0.123456789, -0.987654321, 1e-8, 0.0, 0.3333333333333333]
+        set_cached_embeddings(MODEL, ["hello"], [vector])
+        (cached,) = get_cached_embeddings(MODEL, ["hello"])
+        assert cached == pytest.approx(vector, rel=1e-6, abs=1e-12)
+
+    def test_packed_as_four_bytes_per_dimension(self):
+        set_cached_embeddings(MODEL, ["hello"], [[0.5] * 512])
+        (blob,) = embedding_cache._conn.execute("SELECT vector FROM embeddings_f32").fetchone()
+        assert len(blob) == 512 * 4
+
+    def test_results_in_input_order_with_misses(self):
+        set_cached_embeddings(MODEL, ["a", "c"], [[1.0], [3.0]])
+        assert get_cached_embeddings(MODEL, ["c", "b", "a"]) == [[3.0], None, [1.0]]
+
+    def test_model_is_part_of_key(self):
+        set_cached_embeddings(MODEL, ["hello"], [[0.25, 0.5]])
+        assert get_cached_embeddings("text-embedding-3-small", ["hello"]) == [None]
+        assert get_cached_embeddings(f"{MODEL}@512", ["hello"]) == [None]
+
+    def test_model_text_boundary_does_not_collide(self):
+        assert embedding_cache._cache_key("ab", "c") != embedding_cache._cache_key("a", "bc")
+
+    def test_legacy_json_table_ignored(self, fresh_cache):
+        key = embedding_cache._cache_key(MODEL, "hello")
+        legacy = sqlite3.connect(fresh_cache)
+        legacy.execute("CREATE TABLE embeddings (key BLOB PRIMARY KEY, vector TEXT NOT NULL)")
+        legacy.execute("INSERT INTO embeddings VALUES (?, ?)", (key, json.dumps([0.1, 0.2])))
+        legacy.commit()
+        legacy.close()
+
+        assert get_cached_embeddings(MODEL, ["hello"]) == [None]
+
+    def test_lookup_batches_over_param_limit(self, monkeypatch):
+        monkeypatch.setattr(embedding_cache, "_MAX_PARAMS_PER_QUERY", 2)
+        texts = [f"t{i}" for i in range(5)]
+        set_cached_embeddings(MODEL, texts, [[float(i)] for i in range(5)])
+        assert get_cached_embeddings(MODEL, texts) == [[float(i)] for i in range(5)]
@@ -0,0 +1,101 @@
+"""Search cache tests — TTL expiry, disable switch, key canonicalisation."""
+
+import os
+import sys
+
+# Ensure the backend package is importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import asyncio
+
+import pytest
+
+from app.services import search_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(tmp_path, monkeypatch):
+    """Point the cache at a throwaway SQLite file with default TTLs."""
+    monkeypatch.setenv("SEARCH_CACHE_PATH", str(tmp_path / "search_cache.sqlite3"))
+    for name in ("SEARCH_CACHE_TTL_HOURS", "INFERENCE_CACHE_TTL_HOURS", "REASONING_CACHE_TTL_HOURS"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(search_cache, "_conn", None)
+    yield
+    if search_cache._conn is not None:
+        search_cache._conn.close()
+
+
+# ===================================================================== #
+#  Unit tests: search_cache                                               #
+# ===================================================================== #
+
+class TestSearchCache:
+    def test_roundtrip(self):
+        search_cache.set_cached("exa", {"query": "crm"}, [{"url": "https://a.com"}])
+        assert search_cache.get_cached("exa", {"query": "crm"}) == [{"url": "https://a.com"}]
+
+    def test_miss(self):
+        assert search_cache.get_cached("exa", {"query": "unknown"}) is None
+
+    def test_service_is_part_of_key(self):
+        search_cache.set_cached("exa", {"query": "crm"}, [1])
+        assert search_cache.get_cached("tavily", {"query": "crm"}) is None
+
+    def test_entry_expires_after_ttl(self, monkeypatch):
+        monkeypatch.setenv("SEARCH_CACHE_TTL_HOURS", "1")
+        now = 1_000_000.0
+        monkeypatch.setattr(search_cache.time, "time", lambda: now)
+        search_cache.set_cached("exa", {"query": "crm"}, [1])
+
+        monkeypatch.setattr(search_cache.time, "time", lambda: now + 3599)
+        assert search_cache.get_cached("exa", {"query": "crm"}) == [1]
+        monkeypatch.setattr(search_cache.time, "time", lambda: now + 3601)
+        assert search_cache.get_cached("exa", {"query": "crm"}) is None
+
+    def test_zero_ttl_disables_cache(self, monkeypatch):
+        monkeypatch.setenv("SEARCH_CACHE_TTL_HOURS", "0")
+        search_cache.set_cached("exa", {"query": "crm"}, [1])
+        assert search_cache.get_cached("exa", {"query": "crm"}) is None
+        assert search_cache._conn is None  # never even opened
+
+    def test_zero_ttl_hides_existing_entries(self, monkeypatch):
+        search_cache.set_cached("exa", {"query": "crm"}, [1])
+        monkeypatch.setenv("SEARCH_CACHE_TTL_HOURS", "0")
+        assert search_cache.get_cached("exa", {"query": "crm"}) is None
+
+    def test_invalid_ttl_uses_default(self, monkeypatch):
+        monkeypatch.setenv("SEARCH_CACHE_TTL_HOURS", "soon")
+        assert search_cache._ttl_seconds("exa") == search_cache._DEFAULT_TTL_HOURS * 3600.0
+
+    def test_api_key_stripped_from_key(self):
+        search_cache.set_cached("serpapi_trends", {"q": "crm", "api_key": "secret-a"}, [5])
+        assert search_cache.get_cached("serpapi_trends", {"q": "crm", "api_key": "secret-b"}) == [5]
+        assert search_cache.get_cached("serpapi_trends", {"q": "crm"}) == [5]
+
+    def test_api_key_not_stored(self):
+        search_cache.set_cached("serpapi_trends", {"q": "crm", "api_key": "secret-a"}, [5])
+        assert search_cache._cache_key("x", {"q": 1, "api_key": "k"}) == search_cache._cache_key("x", {"q": 1})
+        dump = "\n".join(search_cache._conn.iterdump())
+        assert "secret-a" not in dump
+
+    def test_key_ignores_field_order(self):
+        assert search_cache._cache_key("exa", {"a": 1, "b": 2}) == search_cache._cache_key("exa", {"b": 2, "a": 1})
+
+    def test_llm_services_off_by_default(self):
+        search_cache.set_cached("inference", {"description": "x"}, {"revenue_model": "Subscription"})
+        search_cache.set_cached("reasoning", {"prompt": "x"}, {"confidence": "high"})
+        assert search_cache.get_cached("inference", {"description": "x"}) is None
+        assert search_cache.get_cached("reasoning", {"prompt": "x"}) is None
+
+    def test_llm_services_use_own_ttl(self, monkeypatch):
+        monkeypatch.setenv("SEARCH_CACHE_TTL_HOURS", "0")
+        monkeypatch.setenv("REASONING_CACHE_TTL_HOURS", "1")
+        search_cache.set_cached("reasoning", {"prompt": "x"}, {"confidence": "high"})
+        assert search_cache.get_cached("reasoning", {"prompt": "x"}) == {"confidence": "high"}
+
+    def test_async_wrappers(self):
+        async def roundtrip():
+            await search_cache.set_cached_async("tavily", {"query": "crm"}, [2])
+            return await search_cache.get_cached_async("tavily", {"query": "crm"})
+
+        assert asyncio.run(roundtrip()) == [2]
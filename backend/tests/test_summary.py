@@ -0,0 +1,47 @@
+"""Evaluation summary tests — verdict bands, risk level, strength / risk modules."""
+
+import os
+import sys
+
+# Ensure the backend package is importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.schemas.score_schema import ModuleScores
+from app.services.summary import generate_summary
+
+
+def _scores(final=60.0, competition=70.0, execution=70.0, **overrides):
+    values = {
+        "problem_intensity": 50.0,
+        "market_timing": 50.0,
+        "competition_pressure": competition,
+        "market_potential": 50.0,
+        "execution_feasibility": execution,
+        "final_viability_score": final,
+    }
+    values.update(overrides)
+    return ModuleScores(**values)
+
+
+# ===================================================================== #
+#  Unit tests: generate_summary                                           #
+# ===================================================================== #
+
+class TestGenerateSummary:
+    def test_verdict_band_edges(self):
+        assert generate_summary(_scores(final=54.99))["verdict"] == "Weak"
+        assert generate_summary(_scores(final=55.0))["verdict"] == "Moderate"
+        assert generate_summary(_scores(final=74.99))["verdict"] == "Moderate"
+        assert generate_summary(_scores(final=75.0))["verdict"] == "Strong"
+
+    def test_risk_level(self):
+        assert generate_summary(_scores(competition=39.0))["risk_level"] == "High"
+        assert generate_summary(_scores(execution=29.0))["risk_level"] == "High"
+        assert generate_summary(_scores(competition=59.0))["risk_level"] == "Medium"
+        assert generate_summary(_scores(execution=49.0))["risk_level"] == "Medium"
+        assert generate_summary(_scores())["risk_level"] == "Low"
+
+    def test_key_strength_and_risk(self):
+        summary = generate_summary(_scores(problem_intensity=90.0, market_timing=10.0))
+        assert summary["key_strength"] == "Problem Intensity"
+        assert summary["key_risk"] == "Market Timing"
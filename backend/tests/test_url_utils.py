@@ -0,0 +1,68 @@
+"""URL canonicalisation tests — canonical_url and url_key dedup keys."""
+
+import os
+import sys
+
+# Ensure the backend package is importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.url_utils import canonical_url, url_key
+
+
+# ===================================================================== #
+#  Unit tests: canonical_url                                              #
+# ===================================================================== #
+
+class TestCanonicalUrl:
+    def test_scheme_and_host_case_normalised(self):
+        assert canonical_url("HTTPS://WWW.Example.COM/Path") == "example.com/Path"
+        assert canonical_url("http://example.com/a") == canonical_url("https://example.com/a")
+
+    def test_path_case_kept(self):
+        assert canonical_url("https://example.com/Path") != canonical_url("https://example.com/path")
+
+    def test_trailing_slash_removed(self):
+        assert canonical_url("https://example.com/a/") == "example.com/a"
+        assert canonical_url("https://example.com/") == "example.com"
+
+    def test_default_ports_dropped(self):
+        assert canonical_url("http://example.com:80/a") == "example.com/a"
+        assert canonical_url("https://example.com:443/a") == "example.com/a"
+
+    def test_non_default_ports_kept(self):
+        assert canonical_url("https://example.com:8080/a") == "example.com:8080/a"
+        assert canonical_url("http://example.com:443/a") == "example.com:443/a"
+
+    def test_fragment_removed(self):
+        assert canonical_url("https://example.com/a#section-2") == "example.com/a"
+
+    def test_tracking_params_removed(self):
+        url = "https://example.com/a?utm_source=x&id=3&fbclid=y&UTM_Medium=z"
+        assert canonical_url(url) == "example.com/a?id=3"
+
+    def test_only_tracking_params_leaves_no_query(self):
+        assert canonical_url("https://example.com/?ref=hn") == "example.com"
+
+    def test_unparseable_returned_stripped(self):
+        assert canonical_url("  not a url  ") == "not a url"
+        assert canonical_url("http://[::1/") == "http://[::1/"
+
+
+# ===================================================================== #
+#  Unit tests: url_key                                                    #
+# ===================================================================== #
+
+class TestUrlKey:
+    def test_eight_byte_digest(self):
+        assert len(url_key("https://example.com/a")) == 8
+
+    def test_cosmetic_variants_share_key(self):
+        variants = (
+            "https://www.example.com/a/",
+            "http://EXAMPLE.com:80/a?utm_campaign=spring",
+            "https://example.com:443/a#top",
+        )
+        assert len({url_key(u) for u in variants}) == 1
+
+    def test_different_pages_differ(self):
+        assert url_key("https://example.com/a") != url_key("https://example.com/b")